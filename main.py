@@ -2,25 +2,52 @@
 
 from __future__ import annotations
 
+import gc
 import os
 import pygame
 import random
-import math
+from collections import deque
 
+from src import image_cache
 from src.constants import *
 from src.models import SpawnPoint
 from src.zombie import Zombie
 from src.brain import Brain
 from src.logger import GameLogger
-from ui import HUD, GameOverScreen
+from src.particles import UNIT_DIRECTIONS, ParticleBuffer, build_particle_atlas
+from ui import HUD, GameOverScreen, TextCache
 from src.spawner import Spawner
 
+def _compact_dead(entities: list) -> None:
+    """Remove dead entities in place with swap-and-pop (order is not preserved)."""
+    i = len(entities) - 1
+    while i >= 0:
+        if entities[i].dead:
+            # Everything past i is already known alive, so the swapped-in tail is too
+            entities[i] = entities[-1]
+            entities.pop()
+        i -= 1
+
+
+def _unique_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Drop exact duplicates (e.g. an entity's unchanged bounds from last frame), keeping order."""
+    return list({tuple(rect): rect for rect in rects}.values())
+
+
 class Game:
     """
     Main game controller: initializes subsystems, runs the loop, handles input,
     updates entities, and draws the frame.
     """
 
+    # Window contents were lost (uncovered, restored from minimized); the whole frame must be presented again
+    EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+    # Only event types the game reacts to; everything else is blocked from the queue
+    HANDLED_EVENTS = (pygame.QUIT, pygame.VIDEORESIZE, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                      *EXPOSE_EVENTS)
+    # Controls hint shown along the top of the playfield
+    HINT_TEXT = "[LMB] hit | [P] pause | [F] fps | [B] hitbox | [R] reset | [M] mute | [ESC] quit"
+
     def __init__(self) -> None:
         """Initialize subsystems, load assets, and set initial game state."""
         pygame.init()
@@ -28,25 +55,50 @@ class Game:
 
         # Make window resizable
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+        # Decode every image up front on worker threads; the loaders below then hit the cache
+        image_cache.preload([(BACKGROUND_PATH, False), (HAMMER_PATH, True),
+                             (ZOMBIE_SPRITE_PATH, True), (BRAIN_PATH, True)])
+
+        # SDL drops blocked events before queueing them, so high-rate MOUSEMOTION
+        # never allocates Event objects (cursor and sliders poll the mouse instead)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
-        self.font_small = pygame.font.Font(FONT_NAME, FONT_SIZE_MEDIUM)
-        self.font_big = pygame.font.Font(FONT_NAME, FONT_SIZE_LARGE)
+        self.fonts: dict[int, pygame.font.Font] = {}   # point size -> loaded font, see get_font()
+        self.font_small = self.get_font(FONT_SIZE_MEDIUM)
+        self.font_big = self.get_font(FONT_SIZE_LARGE)
+        self.font_tiny = self.get_font(FONT_SIZE_SMALL)     # start screen instructions
+        self.text_cache = TextCache()
         self.current_width = WIDTH
         self.current_height = HEIGHT
         self.background_img: pygame.Surface | None = None
         self.load_background()
         self.spawn_points: list[SpawnPoint] = self.make_spawn_points()
         self.spawner = Spawner(self.spawn_points)
+
+        # Dirty-rect rendering: erase last frame's rects from the static frame, present only changes
+        self.static_frame: pygame.Surface | None = None
+        self.dirty_rects: list[pygame.Rect] = []
+        self.needs_full_redraw = True
+        self.frozen_cursor_pos: tuple[int, int] | None = None   # cursor position last presented over frozen_frame
+        self.build_static_frame()
+        self.layout_start_screen()
+        self.hint_rect: pygame.Rect | None = None   # placed on first draw
         self.logger = GameLogger(LOG_FILE)
 
-        # Game state
+        # Game state. The entity containers live for the whole session; reset_game() empties them in place
+        self.zombies: list[Zombie] = []
+        self.brains: list[Brain] = []
         self.reset_game()
         self.game_over = False
         self.paused = False
         self.show_fps = False
         self.show_hitboxes = False      # Toggle for displaying zombie hitboxes
-        self.fps_samples = []
+        self.fps_samples: deque[float] = deque(maxlen=FPS_SAMPLES)
+        self.fps_sum = 0.0              # running total of fps_samples
         self.life_lost_flash = 0        # Timer for life lost screen flash
+        self.mouse_pos = (0, 0)         # Mouse snapshot, refreshed once per frame
+        self.mouse_buttons = (False, False, False)
         
         # Pause-aware timing
         self.total_pause_time = 0       # Cumulative time spent paused (in ms)
@@ -65,17 +117,25 @@ class Game:
 
         self.hammer_cursor = None
         self.load_hammer_cursor()
-        self.hammer_hit_effects = []
+        self.hammer_particles = ParticleBuffer(MAX_HAMMER_EFFECTS, HAMMER_PARTICLE_MAX_LIFE,
+                                               HAMMER_PARTICLE_GRAVITY, PARTICLE_STEP_MS)
+        self.hammer_particle_tiles = build_particle_atlas(HAMMER_PARTICLE_COLOR, HAMMER_PARTICLE_SIZES)
+        # Decode sprites and render every particle tile now, not on the first spawn/hit mid-game
+        Zombie.load_sprites()
+        Zombie.particle_tiles()
+        Brain.load_sprite()
 
     def reset_game(self) -> None:
         """Reset all game state to initial values."""
-        self.zombies: list[Zombie] = []
-        self.brains: list[Brain] = []
+        # Empty the existing containers rather than allocating new ones on every restart
+        self.zombies.clear()
+        self.brains.clear()
         self.hits = 0
         self.misses = 0
         self.lives = INITIAL_LIVES
         self.level = 1
         self.game_over = False
+        self.frozen_frame: pygame.Surface | None = None   # composed game-over/pause screen, reused while it shows
         self.spawner.next_spawn_at = 0          # Reset spawner timing
         self.spawner.next_brain_check_at = 0    # Reset brain spawning timing
         pygame.mouse.set_visible(False)         # Hide system cursor for hammer display
@@ -100,6 +160,12 @@ class Game:
         else:
             return wall_time - self.total_pause_time
 
+    def request_full_redraw(self) -> None:
+        """Make the next draw() recompose and present the whole window, frozen screens included."""
+        self.needs_full_redraw = True
+        self.frozen_frame = None        # a frozen screen is rebuilt by the full redraw
+        self.frozen_cursor_pos = None
+
     def update_level(self) -> None:
         """Update game level based on zombies killed."""
         new_level = min(MAX_LEVEL, (self.hits // ZOMBIES_PER_LEVEL) + 1)
@@ -109,6 +175,8 @@ class Game:
             if self.snd_level_up and not self.muted:
                 self.snd_level_up.play()
             self.logger.log_level_up(self.level)
+            self.logger.flush()
+            gc.collect()    # automatic GC is off during play; level changes are a natural break
             
     # --------------------------------- Setup ----------------------------------------
 
@@ -117,9 +185,10 @@ class Game:
         Load hammer cursor image and set initial size.
         """
         if os.path.exists(HAMMER_PATH):
-            self.original_hammer = pygame.image.load(HAMMER_PATH).convert_alpha()
+            self.original_hammer = image_cache.load(HAMMER_PATH)
             # Store original for responsive scaling
             self.hammer_cursor = pygame.transform.scale(self.original_hammer, (40, 40))
+            self.update_hammer_cursor_offset()
         else:
             self.original_hammer = None
             self.hammer_cursor = None
@@ -130,7 +199,8 @@ class Game:
         """
         if os.path.exists(BACKGROUND_PATH):
             try:
-                img = pygame.image.load(BACKGROUND_PATH).convert()
+                # Decoded once; a resize only rescales the cached original
+                img = image_cache.load(BACKGROUND_PATH, alpha=False)
                 # Use current window size for scaling
                 width = getattr(self, 'current_width', WIDTH)
                 height = getattr(self, 'current_height', HEIGHT)
@@ -142,11 +212,24 @@ class Game:
             print(f"Background image not found: {BACKGROUND_PATH}")
             self.background_img = None
     
+    def build_static_frame(self) -> None:
+        """
+        Pre-compose the static playfield (background image or hole grid) at the
+        current window size. Frames are erased by copying regions of it back.
+        """
+        if self.background_img:
+            # Already window-sized and in display format; nothing is drawn on top, so use it as-is
+            self.static_frame = self.background_img
+        else:
+            self.static_frame = pygame.Surface((self.current_width, self.current_height)).convert()
+            self.draw_background(self.static_frame)
+        self.needs_full_redraw = True
+
     def make_spawn_points(self) -> list[SpawnPoint]:
         """
         20 spawn points (4 rows x 5 columns) positioned to align with tombs in background image.
         """
-        cols, rows = 5, 4
+        cols, rows = SPAWN_GRID_COLS, SPAWN_GRID_ROWS
         # Get current window dimensions
         width = getattr(self, 'current_width', WIDTH)
         height = getattr(self, 'current_height', HEIGHT)
@@ -164,24 +247,12 @@ class Game:
 
         start_x, start_y = 160, 75
         x_gap, y_gap = 155, 115
-        base_positions = [
-            (start_x + col * x_gap, start_y + row * y_gap)
-            for row in range(rows)
-            for col in range(cols)
-        ]
-
-        # Scale positions to current window size
-        spawn_positions = []
-        for base_x, base_y in base_positions:
-            scaled_x = int(base_x * scale_x)
-            scaled_y = int(base_y * scale_y)
-            spawn_positions.append((scaled_x, scaled_y))
-
-        spawn_points = []
-        for pos in spawn_positions:
-            spawn_points.append(SpawnPoint(pos, radius=SPAWN_RADIUS))
-
-        return spawn_points
+        # Scale each column/row coordinate once, then combine them row-major
+        xs = [int((start_x + col * x_gap) * scale_x) for col in range(cols)]
+        ys = [int((start_y + row * y_gap) * scale_y) for row in range(rows)]
+        # Grid order is stable across resizes, so the index identifies the same tomb at any size
+        return [SpawnPoint((x, y), radius=SPAWN_RADIUS, index=row * cols + col)
+                for row, y in enumerate(ys) for col, x in enumerate(xs)]
 
     def init_audio(self) -> None:
         """
@@ -237,15 +308,16 @@ class Game:
             # Reload background with new size
             self.load_background()
             
-            # Store old spawn points for entity relocation
-            old_spawn_points = self.spawn_points.copy()
-            
             # Recalculate spawn points for new dimensions
             self.spawn_points = self.make_spawn_points()
             self.spawner.update_spawn_points(self.spawn_points)
+            self.build_static_frame()
+            self.layout_start_screen()
+            self.hint_rect = None
+            self.frozen_frame = None
             
             # Relocate existing entities to new spawn point positions
-            self.relocate_entities_to_new_spawn_points(old_spawn_points)
+            self.relocate_entities_to_new_spawn_points()
             
             # Update zombie and brain scaling
             self.update_entity_scaling(scale_factor)
@@ -253,41 +325,30 @@ class Game:
             # Update font sizes for responsive text
             self.update_font_scaling(scale_factor)
             
-            print(f"Window resized to {new_width}x{new_height} with scale factor {scale_factor:.2f}")
-            print(f"Screen surface size: {self.screen.get_size()}")
-            print(f"Current dimensions: {self.current_width}x{self.current_height}")
+            if DEBUG:
+                print(f"Window resized to {new_width}x{new_height} with scale factor {scale_factor:.2f}")
+                print(f"Screen surface size: {self.screen.get_size()}")
+                print(f"Current dimensions: {self.current_width}x{self.current_height}")
 
-    def relocate_entities_to_new_spawn_points(self, old_spawn_points: list[SpawnPoint]) -> None:
+    def relocate_entities_to_new_spawn_points(self) -> None:
         """
         Relocate existing zombies and brains to their new spawn point positions
         after window resize. This ensures entities stay in the correct relative
         positions on the screen.
+
+        The new spawn point with the same grid index as an entity's old one is
+        the same tomb.
         """
-        # Create a mapping from old spawn point positions to new spawn point positions
-        # We'll match them based on their relative grid position (row, column)
-        old_to_new_mapping = {}
-        
-        # Calculate grid positions for old spawn points (5 columns, 4 rows)
-        cols, rows = 5, 4
-        for i, old_spawn in enumerate(old_spawn_points):
-            row = i // cols
-            col = i % cols
-            # Find the corresponding new spawn point at the same grid position
-            new_index = row * cols + col
-            if new_index < len(self.spawn_points):
-                old_to_new_mapping[old_spawn] = self.spawn_points[new_index]
-        
-        # Update zombie spawn point references
+        spawn_points = self.spawn_points
         for zombie in self.zombies:
-            if zombie.spawn in old_to_new_mapping:
-                zombie.spawn = old_to_new_mapping[zombie.spawn]
-                print(f"Relocated zombie from {zombie.spawn.pos} to new position")
-        
-        # Update brain spawn point references
+            zombie.move_to(spawn_points[zombie.spawn.index])
+            if DEBUG:
+                print(f"Relocated zombie to {zombie.spawn.pos}")
+
         for brain in self.brains:
-            if brain.spawn in old_to_new_mapping:
-                brain.spawn = old_to_new_mapping[brain.spawn]
-                print(f"Relocated brain from {brain.spawn.pos} to new position")
+            brain.spawn = spawn_points[brain.spawn.index]
+            if DEBUG:
+                print(f"Relocated brain to {brain.spawn.pos}")
 
     def update_entity_scaling(self, scale_factor: float) -> None:
         """Update scaling for all game entities (zombies, brains, etc.)."""
@@ -300,15 +361,23 @@ class Game:
             if hasattr(brain, 'update_scale_factor'):
                 brain.update_scale_factor(scale_factor)
 
+    def get_font(self, size: int) -> pygame.font.Font:
+        """Return the game font at this point size, reading the font file only the first time."""
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(FONT_NAME, size)
+        return font
+
     def update_font_scaling(self, scale_factor: float) -> None:
         """Update font sizes for responsive text scaling."""
         # Calculate new font sizes based on scale factor
         new_small_size = max(12, int(FONT_SIZE_SMALL * scale_factor))
         new_large_size = max(18, int(FONT_SIZE_LARGE * scale_factor))
         
-        # Update font objects
-        self.font_small = pygame.font.Font(FONT_NAME, new_small_size)
-        self.font_big = pygame.font.Font(FONT_NAME, new_large_size)
+        # Update font objects (a size seen before reuses its loaded font)
+        self.font_small = self.get_font(new_small_size)
+        self.font_big = self.get_font(new_large_size)
+        self.text_cache.clear()
         
         # Update UI component fonts
         self.hud.update_fonts(self.font_small)
@@ -327,6 +396,12 @@ class Game:
             base_size = 40
             new_size = max(20, int(base_size * scale_factor))
             self.hammer_cursor = pygame.transform.scale(self.original_hammer, (new_size, new_size))
+            self.update_hammer_cursor_offset()
+
+    def update_hammer_cursor_offset(self) -> None:
+        """Top-left offset from the mouse that centres the cursor 5px down-right of the pointer."""
+        width, height = self.hammer_cursor.get_size()
+        self.hammer_cursor_offset = (5 - width // 2, 5 - height // 2)
 
     # --------------------------------- Loop -----------------------------------------
     
@@ -339,19 +414,30 @@ class Game:
         bool
             True if user wants to start game, False if quit
         """
-        clock = pygame.time.Clock()
+        clock = self.clock      # the game loop keeps ticking the same clock
         
         # Hide system cursor and use hammer cursor
         pygame.mouse.set_visible(False)
+        drawn_mouse = None      # mouse state the start screen on display was drawn for
         
         while True:
-            mouse_pos = pygame.mouse.get_pos()
+            # Sleep in SDL until an event arrives or the mouse is due to be polled again (motion is blocked)
+            first_event = pygame.event.wait(1000 // FPS)
+            events = pygame.event.get(self.HANDLED_EVENTS)
+            if first_event.type != pygame.NOEVENT:
+                events.insert(0, first_event)
+
+            # One mouse snapshot per frame, shared by the slider, button and cursor code
+            self.mouse_pos = mouse_pos = pygame.mouse.get_pos()
+            self.mouse_buttons = pygame.mouse.get_pressed()
             
-            for event in pygame.event.get():
+            # A resize drag floods VIDEORESIZE; only the last size of the frame is applied
+            pending_resize = None
+            for event in events:
                 if event.type == pygame.QUIT:
                     return False
                 if event.type == pygame.VIDEORESIZE:
-                    self.handle_resize(event.w, event.h)
+                    pending_resize = (event.w, event.h)
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         return False
@@ -359,33 +445,53 @@ class Game:
                         return True
                     if event.key == pygame.K_m:
                         self.toggle_mute()
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.check_start_button_click(mouse_pos):
-                    return True
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if pending_resize:
+                        # Hit-test against the layout the player is actually looking at
+                        self.handle_resize(*pending_resize)
+                        pending_resize = None
+                    # The event carries where the button went down, even if the mouse has moved since
+                    if self.check_start_button_click(event.pos):
+                        return True
+            if pending_resize:
+                self.handle_resize(*pending_resize)
             
-            self.draw_start_screen(None, mouse_pos)
+            # Nothing on the start screen animates by itself: without events, and with the
+            # mouse where it was, the frame on display is still current
+            mouse_state = (mouse_pos, self.mouse_buttons)
+            if events or mouse_state != drawn_mouse:
+                self.draw_start_screen(None, mouse_pos)
+                drawn_mouse = mouse_state
             clock.tick(FPS)
     
+    def layout_start_screen(self) -> None:
+        """Place the start screen's sliders and button for the current window size."""
+        center_x, center_y = self.current_width // 2, self.current_height // 2
+        self.bgm_slider_rect = pygame.Rect(center_x - 100, center_y - 80, 200, 20)
+        self.sfx_slider_rect = pygame.Rect(center_x - 100, center_y - 30, 200, 20)
+        self.start_button_rect = pygame.Rect(center_x - 100, center_y + 50, 200, 50)
+
     def check_start_button_click(self, mouse_pos: tuple[int, int]) -> bool:
         """Check if start button was clicked."""
-        button_rect = pygame.Rect(self.current_width//2 - 100, self.current_height//2 + 50, 200, 50)
-        return button_rect.collidepoint(mouse_pos)
+        return self.start_button_rect.collidepoint(mouse_pos)
     
     def handle_volume_slider_interaction(self, mouse_pos: tuple[int, int], mouse_pressed: bool) -> bool:
         """Handle volume slider interactions - both clicks and drags."""
+        if not mouse_pressed:
+            return False
+
         # BGM Volume slider
-        bgm_rect = pygame.Rect(self.current_width // 2 - 100, self.current_height // 2 - 80, 200, 20)
-        if bgm_rect.collidepoint(mouse_pos) and mouse_pressed:
+        bgm_rect = self.bgm_slider_rect
+        if bgm_rect.collidepoint(mouse_pos):
             relative_x = mouse_pos[0] - bgm_rect.x
             self.bgm_volume = max(0.0, min(1.0, relative_x / bgm_rect.width))
-            try:
-                pygame.mixer.music.set_volume(self.bgm_volume)
-            except:
-                pass
+            # The mixer is initialized unconditionally in init_audio(), so this cannot fail here
+            pygame.mixer.music.set_volume(self.bgm_volume)
             return True
         
         # SFX Volume slider
-        sfx_rect = pygame.Rect(self.current_width//2 - 100, self.current_height//2 - 30, 200, 20)
-        if sfx_rect.collidepoint(mouse_pos) and mouse_pressed:
+        sfx_rect = self.sfx_slider_rect
+        if sfx_rect.collidepoint(mouse_pos):
             relative_x = mouse_pos[0] - sfx_rect.x
             self.sfx_volume = max(0.0, min(1.0, relative_x / sfx_rect.width))
             if self.snd_hit:
@@ -401,25 +507,24 @@ class Game:
         # Clear the entire screen to prevent visual artifacts
         self.screen.fill(BG_COLOR)
 
-        title_text = self.font_big.render("WHACK-A-ZOMBIE", True, (255, 255, 100))
+        title_text = self.text_cache.render(self.font_big, "WHACK-A-ZOMBIE", (255, 255, 100))
         title_rect = title_text.get_rect(center=(self.current_width // 2, self.current_height // 2 - 200))
         self.screen.blit(title_text, title_rect)
         
         self.draw_volume_sliders()
         
         # Handle volume slider dragging
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        self.handle_volume_slider_interaction(mouse_pos, mouse_pressed)
+        self.handle_volume_slider_interaction(mouse_pos, self.mouse_buttons[0])
         
         # Start button
-        button_rect = pygame.Rect(self.current_width // 2 - 100, self.current_height // 2 + 50, 200, 50)
+        button_rect = self.start_button_rect
         button_hovered = button_rect.collidepoint(mouse_pos)
         
         button_color = (100, 150, 100) if button_hovered else (60, 80, 60)
         pygame.draw.rect(self.screen, button_color, button_rect)
         pygame.draw.rect(self.screen, TEXT_COLOR, button_rect, 2)
         
-        start_text = self.font_small.render("START GAME", True, TEXT_COLOR)
+        start_text = self.text_cache.render(self.font_small, "START GAME", TEXT_COLOR)
         start_rect = start_text.get_rect(center=button_rect.center)
         self.screen.blit(start_text, start_rect)
         
@@ -435,8 +540,8 @@ class Game:
         y_start = self.current_height//2 + 120
         for i, instruction in enumerate(instructions):
             color = (255, 255, 100) if i == 0 else (180, 180, 180)
-            font = self.font_small if i == 0 else pygame.font.Font(FONT_NAME, FONT_SIZE_SMALL)
-            text = font.render(instruction, True, color)
+            font = self.font_small if i == 0 else self.font_tiny
+            text = self.text_cache.render(font, instruction, color)
             text_rect = text.get_rect(center=(self.current_width//2, y_start + i * 25))
             self.screen.blit(text, text_rect)
         
@@ -448,7 +553,7 @@ class Game:
     def draw_volume_sliders(self) -> None:
         """Draw volume control sliders with text labels on the right side."""
         # BGM Volume
-        bgm_rect = pygame.Rect(self.current_width//2 - 100, self.current_height//2 - 80, 200, 20)
+        bgm_rect = self.bgm_slider_rect
         pygame.draw.rect(self.screen, (100, 100, 100), bgm_rect)
         pygame.draw.rect(self.screen, TEXT_COLOR, bgm_rect, 2)
         
@@ -460,12 +565,12 @@ class Game:
         
         # BGM label on the right side of the slider
         bgm_percent = int(self.bgm_volume * 100)
-        bgm_label = self.font_small.render(f"BGM Volume: {bgm_percent}%", True, TEXT_COLOR)
+        bgm_label = self.text_cache.render(self.font_small, f"BGM Volume: {bgm_percent}%", TEXT_COLOR)
         bgm_label_pos = (bgm_rect.x + bgm_rect.width + 15, bgm_rect.y + bgm_rect.height // 2 - bgm_label.get_height() // 2)
         self.screen.blit(bgm_label, bgm_label_pos)
         
         # SFX Volume
-        sfx_rect = pygame.Rect(self.current_width//2 - 100, self.current_height//2 - 30, 200, 20)
+        sfx_rect = self.sfx_slider_rect
         pygame.draw.rect(self.screen, (100, 100, 100), sfx_rect)
         pygame.draw.rect(self.screen, TEXT_COLOR, sfx_rect, 2)
         
@@ -477,98 +582,164 @@ class Game:
         
         # SFX label on the right side of the slider
         sfx_percent = int(self.sfx_volume * 100)
-        sfx_label = self.font_small.render(f"SFX Volume: {sfx_percent}%", True, TEXT_COLOR)
+        sfx_label = self.text_cache.render(self.font_small, f"SFX Volume: {sfx_percent}%", TEXT_COLOR)
         sfx_label_pos = (sfx_rect.x + sfx_rect.width + 15, sfx_rect.y + sfx_rect.height // 2 - sfx_label.get_height() // 2)
         self.screen.blit(sfx_label, sfx_label_pos)
 
     def run(self) -> None:
         """Main game entry point: show start screen then run game loop."""
         if not self.show_start_screen():
+            self.logger.close()
             pygame.quit()
             return
         self.run_game_loop()
     
     def run_game_loop(self) -> None:
         """Main game loop: process events, update, render; exits on quit request."""
+        # Bind per-frame lookups to locals once so the loop body uses fast local access
+        clock = self.clock
+        get_events = pygame.event.get
+        handled_events = self.HANDLED_EVENTS
+        expose_events = self.EXPOSE_EVENTS
+        get_time = self.get_game_time
+        get_mouse_pos = pygame.mouse.get_pos
+        draw = self.draw
+        fps_samples = self.fps_samples
+        spawner = self.spawner
+        hammer_particles = self.hammer_particles
+        QUIT, VIDEORESIZE = pygame.QUIT, pygame.VIDEORESIZE
+        KEYDOWN, MOUSEBUTTONDOWN = pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN
+
+        # Automatic GC can pause mid-frame; move startup objects out of its reach, then only
+        # collect at natural breaks (level up, pause, game over) and every GC_INTERVAL_MS of
+        # play. Plain refcounting still frees the rest.
+        gc.collect()
+        gc.freeze()
+        gc.disable()
+        next_collect_at = get_time() + GC_INTERVAL_MS
+
         running = True
-        while running:
-            current_fps = self.clock.get_fps()
+        try:
+            while running:
+                current_fps = clock.get_fps()
             
-            # Update FPS samples for smoothing
-            self.fps_samples.append(current_fps)
-            if len(self.fps_samples) > 10:
-                self.fps_samples.pop(0)
-            avg_fps = sum(self.fps_samples) / len(self.fps_samples) if self.fps_samples else 0
+                # Update FPS samples for smoothing (running sum; the deque drops the oldest when full)
+                if len(fps_samples) == FPS_SAMPLES:
+                    self.fps_sum -= fps_samples[0]
+                fps_samples.append(current_fps)
+                self.fps_sum += current_fps
+                avg_fps = self.fps_sum / len(fps_samples)
             
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.VIDEORESIZE:
-                    self.handle_resize(event.w, event.h)
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                events = get_events(handled_events)
+                self.mouse_pos = get_mouse_pos()    # after the event pump, so it's this frame's position
+                # A resize drag floods VIDEORESIZE; only the last size of the frame is applied
+                pending_resize = None
+                for event in events:
+                    event_type = event.type
+                    if event_type == QUIT:
                         running = False
-                    elif event.key == pygame.K_r and self.game_over:
-                        self.reset_game()
-                    elif event.key == pygame.K_m:
-                        self.toggle_mute()
-                    elif event.key == pygame.K_p:
-                        self.toggle_pause()
-                    elif event.key == pygame.K_f:
-                        self.show_fps = not self.show_fps
-                    elif event.key == pygame.K_b:
-                        self.show_hitboxes = not self.show_hitboxes
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and not self.paused and not self.game_over:
-                    game_time = self.get_game_time()
-                    self.handle_click(pygame.mouse.get_pos(), game_time)
-
-            # Update game state (only if not paused and not game over)
-            if not self.paused and not self.game_over:
-                # Get pause-aware game time for all entity updates
-                game_time = self.get_game_time()
+                    elif event_type == VIDEORESIZE:
+                        pending_resize = (event.w, event.h)
+                    elif event_type in expose_events:
+                        # Dirty rects only cover what changed; repaint and present everything once
+                        self.request_full_redraw()
+                    elif event_type == KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            running = False
+                        elif event.key == pygame.K_r and self.game_over:
+                            self.reset_game()
+                        elif event.key == pygame.K_m:
+                            self.toggle_mute()
+                        elif event.key == pygame.K_p:
+                            self.toggle_pause()
+                        elif event.key == pygame.K_f:
+                            self.show_fps = not self.show_fps
+                            self.frozen_frame = None
+                        elif event.key == pygame.K_b:
+                            self.show_hitboxes = not self.show_hitboxes
+                            self.frozen_frame = None
+                    elif event_type == MOUSEBUTTONDOWN and event.button == 1 and not self.paused and not self.game_over:
+                        if pending_resize:
+                            # Hit-test against the spawn points the player is actually looking at
+                            self.handle_resize(*pending_resize)
+                            pending_resize = None
+                        game_time = get_time()
+                        self.handle_click(event.pos, game_time)   # where the button went down
+                if pending_resize:
+                    self.handle_resize(*pending_resize)
+
+                # Pause-aware game time, sampled once so updates and drawing see the same instant
+                game_time = get_time()
+
+                # Update game state (only if not paused and not game over)
+                if not self.paused and not self.game_over:
                 
-                # Update zombies and check for attacks
-                attacks_this_frame = 0
-                for z in self.zombies:
-                    z.update_spawn_effects(game_time)
-                    z.update_hit_effects(game_time)
-                    if z.update(game_time):  # Returns True if zombie attacked (only once per zombie)
-                        attacks_this_frame += 1
+                    # Update zombies and check for attacks
+                    attacks_this_frame = 0
+                    zombies_died = False
+                    zombies = self.zombies
+                    for z in zombies:
+                        if game_time < z.wake_at:
+                            continue    # idle until its next state change; cannot die before then
+                        if z.tick(game_time):  # Returns True if zombie attacked (only once per zombie)
+                            attacks_this_frame += 1
+                        if z.dead:
+                            zombies_died = True
                 
-                # Handle life loss from zombie attacks
-                if attacks_this_frame > 0:
-                    self.lives -= attacks_this_frame
-                    self.life_lost_flash = LIFE_LOSS_FLASH_MS
-                    if self.lives <= 0:
-                        self.lives = 0
-                        self.game_over = True
+                    # Handle life loss from zombie attacks
+                    if attacks_this_frame > 0:
+                        self.lives -= attacks_this_frame
+                        self.life_lost_flash = LIFE_LOSS_FLASH_MS
+                        if self.lives <= 0:
+                            self.lives = 0
+                            self.game_over = True
+                            self.logger.flush()
+                            gc.collect()
                 
-                # Update brains
-                for brain in self.brains:
-                    brain.update(game_time)
+                    # Update brains
+                    brains_died = False
+                    for brain in self.brains:
+                        if game_time < brain.wake_at:
+                            continue    # same deadline skipping as zombies
+                        brain.update(game_time)
+                        if brain.dead:
+                            brains_died = True
                 
-                # Remove dead zombies and brains
-                self.zombies = [z for z in self.zombies if not z.dead]
-                self.brains = [b for b in self.brains if not b.dead]
-
-                # Spawning
-                self.spawner.maybe_spawn(game_time, self.zombies, self.level, self.brains)
-                self.spawner.maybe_spawn_brain(game_time, self.zombies, self.brains)
+                    # Remove dead zombies and brains in place; skipped on frames where nothing died
+                    if zombies_died:
+                        _compact_dead(self.zombies)
+                    if brains_died:
+                        _compact_dead(self.brains)
+
+                    # Spawning; most frames fall between scheduled spawns and skip this entirely
+                    if spawner.is_due(game_time):
+                        spawner.maybe_spawn(game_time, self.zombies, self.level, self.brains)
+                        spawner.maybe_spawn_brain(game_time, self.zombies, self.brains)
             
-            # Update hammer hit effects
-            self.update_hammer_hit_effects()
+                # Update hammer hit effects (idle most frames)
+                if hammer_particles:
+                    self.update_hammer_hit_effects()
             
-            # Update screen flash timer
-            if self.life_lost_flash > 0:
-                self.life_lost_flash = max(0, self.life_lost_flash - self.clock.get_time())
-
-            # Use pause-aware game time for all drawing (animations, timer bars, etc.)
-            game_time = self.get_game_time()
-            self.draw(game_time, avg_fps)
-
-            # Cap frame rate
-            self.clock.tick(FPS)
-
+                # Update screen flash timer; a stall (window drag, resize) is clamped so the
+                # flash still plays out over several frames instead of vanishing in one
+                if self.life_lost_flash > 0:
+                    frame_ms = min(clock.get_time(), MAX_FRAME_MS)
+                    self.life_lost_flash = max(0, self.life_lost_flash - frame_ms)
+
+                # Same game time for all drawing (animations, timer bars, etc.)
+                draw(game_time, avg_fps)
+
+                # Level-ups stop at MAX_LEVEL, so cycles are also collected on a fixed cadence
+                if game_time >= next_collect_at:
+                    gc.collect()
+                    next_collect_at = game_time + GC_INTERVAL_MS
+
+                # Cap frame rate
+                clock.tick(FPS)
+        finally:
+            # Also runs if the loop raises: automatic GC back on and buffered log events on disk
+            gc.enable()
+            self.logger.close()
         pygame.quit()
 
     # --------------------------------- Input ----------------------------------------
@@ -605,11 +776,9 @@ class Game:
                 self.hits += 1                
                 self.create_hammer_hit_effect(pos)
                 
+                # snd_hit is None unless it loaded; play() just returns None when no channel is free
                 if self.snd_hit and not self.muted:
-                    try:
-                        self.snd_hit.play()
-                    except Exception:
-                        pass
+                    self.snd_hit.play()
                 
                 self.logger.log_click(pos, True, f"Zombie at spawn {z.spawn.pos}")
                 self.update_level()
@@ -622,6 +791,7 @@ class Game:
 
     def toggle_pause(self) -> None:
         if not self.game_over:
+            self.frozen_frame = None
             if self.paused:
                 # Unpausing: add elapsed pause time to total
                 if self.pause_start_time is not None:
@@ -633,78 +803,63 @@ class Game:
                 # Pausing: record when pause started
                 self.pause_start_time = pygame.time.get_ticks()
                 self.paused = True
+                self.logger.flush()
+                gc.collect()    # a pause is a free moment to collect
 
     def toggle_mute(self) -> None:
         self.muted = not self.muted
+        self.frozen_frame = None        # the HUD shows the mute state
         pygame.mixer.music.set_volume(0.0 if self.muted else self.bgm_volume)
 
     # --------------------------------- Rendering ------------------------------------
 
-    def draw_hammer_cursor(self) -> None:
-        """Draw the hammer cursor at mouse position."""
+    def draw_hammer_cursor(self) -> pygame.Rect | None:
+        """Draw the hammer cursor at mouse position and return its rect (None if not drawn)."""
         if self.hammer_cursor:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = self.mouse_pos
             # Ensure cursor position is within screen bounds
             if 0 <= mouse_x < self.current_width and 0 <= mouse_y < self.current_height:
-                # Offset so the hammer "hits" where the cursor points
-                cursor_rect = self.hammer_cursor.get_rect(center=(mouse_x + 5, mouse_y + 5))
-                self.screen.blit(self.hammer_cursor, cursor_rect)
+                # Offset so the hammer "hits" where the cursor points (precomputed per cursor size)
+                offset_x, offset_y = self.hammer_cursor_offset
+                return self.screen.blit(self.hammer_cursor, (mouse_x + offset_x, mouse_y + offset_y))
+        return None
     
     def create_hammer_hit_effect(self, hit_pos: tuple[int, int]) -> None:
         """Create hammer hit effect at click position."""
         
+        emit = self.hammer_particles.emit
+        tiles = self.hammer_particle_tiles
+        rand = random.random
+        x, y = hit_pos
+
         # Create impact particles
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)  # Reduced speed for better visibility
-            dx = math.cos(angle) * speed
-            dy = math.sin(angle) * speed
-            
-            effect = {
-                'x': hit_pos[0],
-                'y': hit_pos[1],
-                'dx': dx,
-                'dy': dy,
-                'life': random.randint(80, 120),  # Increased lifetime
-                'max_life': 120,  # Increased max lifetime
-                'alpha': 255,
-                'size': random.randint(3, 6),  # Slightly larger particles
-            }
-            self.hammer_hit_effects.append(effect)
+        for _ in range(HAMMER_PARTICLES_PER_HIT):
+            # Heading from the precomputed unit-vector table; one RNG call each for speed and life
+            ux, uy = random.choice(UNIT_DIRECTIONS)
+            speed = 1 + 2 * rand()  # Reduced speed for better visibility
+            emit(x, y, ux * speed, uy * speed,
+                 80 + int(41 * rand()),                     # Increased lifetime
+                 tiles[random.choice(HAMMER_PARTICLE_SIZES)])   # Slightly larger particles
     
     def update_hammer_hit_effects(self) -> None:
         """Update hammer hit effect particles."""
-        for effect in self.hammer_hit_effects[:]:
-            effect['life'] -= 16  # 16ms per frame at 60fps
-            if effect['life'] <= 0:
-                self.hammer_hit_effects.remove(effect)
-            else:
-                # Move particles outward
-                effect['x'] += effect['dx']
-                effect['y'] += effect['dy']
-                effect['alpha'] = int(255 * (effect['life'] / effect['max_life']))
-                # Add gravity effect
-                effect['dy'] += 0.3
+        self.hammer_particles.update()
     
-    def draw_hammer_hit_effects(self) -> None:
-        """Draw hammer hit effect particles."""
-        for effect in self.hammer_hit_effects:
-            if effect['alpha'] > 0:
-                # Create particle surface with alpha
-                particle_surf = pygame.Surface((effect['size'], effect['size']), pygame.SRCALPHA)
-                
-                color = (255, 255, 100, effect['alpha'])
-                
-                pygame.draw.circle(particle_surf, color, (effect['size']//2, effect['size']//2), effect['size']//2)
-                self.screen.blit(particle_surf, (effect['x'] - effect['size']//2, effect['y'] - effect['size']//2))
+    def draw_hammer_hit_effects(self) -> pygame.Rect | None:
+        """Draw hammer hit effect particles and return the area they cover (None if there are none)."""
+        if not self.hammer_particles:
+            return None
+        # Pre-rendered circles with the alpha quantized and baked in; one blits() call for all
+        rects = self.screen.blits(self.hammer_particles.blit_sequence())
+        return rects[0].unionall(rects[1:])
 
     def draw_life_loss_flash(self) -> None:
         """Draw screen flash when life is lost."""
-        if self.life_lost_flash > 0:
-            alpha = int(100 * (self.life_lost_flash / LIFE_LOSS_FLASH_MS))
-            flash_surface = pygame.Surface((self.current_width, self.current_height), pygame.SRCALPHA)
-            flash_surface.fill((255, 0, 0, alpha))
-            self.screen.blit(flash_surface, (0, 0))
+        # BLEND_RGB_ADD ignores alpha, so the fade is carried by the red channel itself.
+        # Filling the screen in place avoids allocating a full-window overlay every frame.
+        red = 100 * self.life_lost_flash // LIFE_LOSS_FLASH_MS
+        if red > 0:     # the last few ms round to an invisible tint; skip the full-screen pass
+            self.screen.fill((red, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
 
     def draw_background(self, surf: pygame.Surface) -> None:
         """
@@ -731,6 +886,13 @@ class Game:
     def draw(self, now_ms: int, fps: float) -> None:
         """
         Compose the frame: bg → zombies → HUD → effects → cursor.
+
+        Only the rects drawn last frame are erased (copied back from the static
+        frame) and only those plus this frame's rects are presented. Full-screen
+        overlays (life-loss flash, game over) redraw the whole frame, and the
+        frame after them too so the overlay gets erased. Once the game-over or
+        pause screen stops animating it is kept, and later frames only move
+        the cursor over it.
         
         Parameters
         ----------
@@ -739,41 +901,100 @@ class Game:
         fps : float
             Current frames per second for display
         """
-        self.draw_background(self.screen)
+        screen = self.screen
+        if self.frozen_frame is not None:
+            # The game-over or pause screen is frozen; only the hammer cursor moves over it
+            if self.mouse_pos == self.frozen_cursor_pos:
+                return      # nothing moved since the last present, so skip the blits and the update
+            self.frozen_cursor_pos = self.mouse_pos
+            frame = self.frozen_frame
+            screen.blits([(frame, rect, rect) for rect in self.dirty_rects], False)
+            cursor_rect = self.draw_hammer_cursor()
+            dirty = [cursor_rect] if cursor_rect else []
+            pygame.display.update(self.dirty_rects + dirty)
+            self.dirty_rects = dirty
+            self.needs_full_redraw = True       # whatever comes next starts from a clean frame
+            return
 
-        # Draw active zombies
-        for z in self.zombies:
-            z.draw(self.screen, now_ms)
-            if self.show_hitboxes:
-                z.draw_hitbox(self.screen, now_ms)
-            
-        # Draw active brains
+        full_redraw = self.needs_full_redraw or self.game_over or self.life_lost_flash > 0
+        if full_redraw:
+            screen.blit(self.static_frame, (0, 0))
+        else:
+            # Erase last frame's drawing by copying those areas back from the static frame in one call
+            static = self.static_frame
+            screen.blits([(static, rect, rect) for rect in self.dirty_rects], False)
+        dirty = []
+
+        # Draw active zombies and brains. The lists are compacted as entities die, so no
+        # per-entity dead check is needed here.
+        add_dirty = dirty.append
+        # Effects per zombie, then every zombie and brain sprite in one blits() call on top
+        sprites = []
+        add_sprite = sprites.append
+        for zombie in self.zombies:
+            zombie.draw_effects(screen, now_ms)
+            sprite_blit = zombie.get_sprite_blit(now_ms)
+            if sprite_blit:
+                add_sprite(sprite_blit)
+            add_dirty(zombie.get_draw_bounds())
+        # Brains after zombies so they render on top
         for brain in self.brains:
-            brain.draw(self.screen, now_ms)
-            if self.show_hitboxes:
-                brain.draw_hitbox(self.screen, now_ms)
-
-        self.hud.draw(self.screen, self.hits, self.misses, self.lives, 
-                      self.level, self.show_fps, fps, self.paused, self.muted)
+            sprite_blit = brain.get_sprite_blit(now_ms)
+            if sprite_blit:
+                add_sprite(sprite_blit)
+                add_dirty(sprite_blit[1])
+            elif Brain.sprites_loaded:
+                # Fully faded: no sprite, but the debug outline may still be drawn there
+                add_dirty(brain.get_hitbox_rect())
+        screen.blits(sprites, False)
+        if self.show_hitboxes:
+            # Debug outlines collected in one pass, then drawn in one tight loop (always inside each entity's bounds)
+            outlines = [zombie.hitbox_outline(now_ms) for zombie in self.zombies]
+            outlines.extend(brain.hitbox_outline(now_ms) for brain in self.brains)
+            draw_rect = pygame.draw.rect
+            for color, rect in outlines:
+                draw_rect(screen, color, rect, 2)
+
+        dirty.extend(self.hud.draw(screen, self.hits, self.misses, self.lives,
+                                   self.level, self.show_fps, fps, self.paused, self.muted))
 
         if not self.game_over:
             # title = self.font_big.render("Whack-a-Zombie", True, TEXT_COLOR)
             # title_rect = title.get_rect(center=(self.current_width//2, HUD_PADDING + title.get_height()//2))
             # self.screen.blit(title, title_rect)
             
-            hint_text = "[LMB] hit | [P] pause | [F] fps | [B] hitbox | [R] reset | [M] mute | [ESC] quit"
-            hint = self.font_small.render(hint_text, True, (200, 200, 200))
+            # Fixed text: rendered once per font and reused from the cache
+            hint = self.text_cache.render(self.font_small, self.HINT_TEXT, (200, 200, 200))
             # hint_rect = hint.get_rect(center=(self.current_width//2, HUD_PADDING + title.get_height() + 8 + hint.get_height()//2))
-            hint_rect = hint.get_rect(center=(self.current_width//2, HUD_PADDING + hint.get_height()//2))
-            self.screen.blit(hint, hint_rect)
+            if self.hint_rect is None:      # depends only on window width and font; reset on resize
+                self.hint_rect = hint.get_rect(center=(self.current_width//2, HUD_PADDING + hint.get_height()//2))
+            dirty.append(screen.blit(hint, self.hint_rect))
 
-        self.draw_life_loss_flash()
-        self.draw_hammer_hit_effects()
+        # Both overlays are inactive on most frames; skip the calls entirely then
+        if self.life_lost_flash > 0:
+            self.draw_life_loss_flash()
+        if self.hammer_particles:
+            dirty.append(self.draw_hammer_hit_effects())
         if self.game_over:
-            self.game_over_screen.draw(self.screen, self.hits, self.misses)
-        self.draw_hammer_cursor()
-
-        pygame.display.flip()
+            self.game_over_screen.draw(screen, self.hits, self.misses)
+        # A live FPS readout keeps a paused frame changing, so only cache it when hidden
+        frozen = self.game_over or (self.paused and not self.show_fps)
+        if frozen and self.life_lost_flash <= 0 and not self.hammer_particles:
+            # Nothing under the cursor animates any more; keep this frame (minus the cursor)
+            self.frozen_frame = screen.copy()
+        cursor_rect = self.draw_hammer_cursor()
+        if cursor_rect:
+            dirty.append(cursor_rect)
+
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            # Static entities report the same bounds every frame; present each area once
+            pygame.display.update(_unique_rects(self.dirty_rects + dirty))
+        self.dirty_rects = dirty
+        self.frozen_cursor_pos = None           # the next frozen frame must be presented
+        # A full-screen overlay drawn this frame must be erased by a full redraw next frame
+        self.needs_full_redraw = self.game_over or self.life_lost_flash > 0
 
 Game().run()
 
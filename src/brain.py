@@ -7,6 +7,7 @@ from __future__ import annotations
 import os
 import pygame
 
+from . import image_cache
 from .constants import BRAIN_PATH, BRAIN_LIFETIME_MS
 from .models import SpawnPoint
 
@@ -22,6 +23,10 @@ class Brain:
     Timings are driven via pygame.time.get_ticks()
     """
 
+    # Fixed per-instance slots instead of a per-brain __dict__
+    __slots__ = ("spawn", "born_at", "lifetime", "dead", "picked_up", "pickup_time",
+                 "despawn_start", "wake_at", "scale_factor")
+
     SPAWN_ANIM_MS = 200
     DESPAWN_ANIM_MS = 300
     PICKUP_FLASH_MS = 150
@@ -31,6 +36,13 @@ class Brain:
     # Class variables for sprite management
     sprite_image = None
     sprites_loaded = False
+    scaled_sprites: dict[tuple[int, int], pygame.Surface] = {}   # (w, h) -> original_sprite scaled to it
+    flash_sprites: dict[tuple[int, int], pygame.Surface] = {}    # (w, h) -> that sprite with the pickup flash
+    MAX_CACHED_SIZES = 2    # both caches are flushed wholesale when full, so a resize drag stays bounded
+    # Fades are quantized to 16 alpha steps (alpha >> 4), each rendered once per sprite and step
+    FADE_SHIFT = 4
+    faded_sprites: dict[tuple[int, int, bool, int], pygame.Surface] = {}  # (w, h, flashing, step) -> faded copy
+    MAX_FADED_SPRITES = 2 * 2 * (256 >> FADE_SHIFT)    # two sizes, plain and flash, every step
     
     @classmethod
     def load_sprite(cls):
@@ -40,7 +52,7 @@ class Brain:
             
         if os.path.exists(BRAIN_PATH):
             try:
-                original = pygame.image.load(BRAIN_PATH).convert_alpha()
+                original = image_cache.load(BRAIN_PATH)
                 # Store original for responsive scaling
                 cls.original_sprite = original
                 cls.sprites_loaded = True
@@ -58,6 +70,7 @@ class Brain:
         self.picked_up = False
         self.pickup_time: int | None = None
         self.despawn_start: int | None = None
+        self.wake_at = 0    # game time before which update() has nothing to do
         
         # Store scale factor for responsive sizing
         self.scale_factor = 1.0
@@ -74,6 +87,7 @@ class Brain:
         self.picked_up = True
         self.pickup_time = now_ms
         self.despawn_start = now_ms
+        self.wake_at = now_ms + self.DESPAWN_ANIM_MS
     
     def update(self, now_ms: int) -> None:
         """Update brain state - check for lifetime expiration."""
@@ -86,12 +100,23 @@ class Brain:
         if self.despawn_start is not None and now_ms - self.despawn_start >= self.DESPAWN_ANIM_MS:
             self.dead = True
 
+        # Nothing changes again until the lifetime or the despawn animation runs out
+        if self.despawn_start is not None:
+            self.wake_at = self.despawn_start + self.DESPAWN_ANIM_MS
+        else:
+            self.wake_at = self.born_at + self.lifetime
+
     def update_scale_factor(self, new_scale_factor: float) -> None:
         """Update the brain's scale factor for responsive sizing."""
         self.scale_factor = new_scale_factor
 
     def get_scaled_sprite(self) -> pygame.Surface | None:
-        """Get brain sprite scaled according to current scale factor."""
+        """
+        Get brain sprite scaled according to current scale factor.
+
+        The surface is scaled once per size and shared by every brain, so
+        callers must copy it before changing its alpha or pixels.
+        """
         if not Brain.sprites_loaded or not hasattr(Brain, 'original_sprite'):
             return None
         
@@ -100,7 +125,45 @@ class Brain:
         new_w = int(original_w * Brain.SPRITE_SCALE * self.scale_factor)
         new_h = int(original_h * Brain.SPRITE_SCALE * self.scale_factor)
         
-        return pygame.transform.scale(Brain.original_sprite, (new_w, new_h))
+        sprite = Brain.scaled_sprites.get((new_w, new_h))
+        if sprite is None:
+            sprite = pygame.transform.scale(Brain.original_sprite, (new_w, new_h))
+            if len(Brain.scaled_sprites) >= Brain.MAX_CACHED_SIZES:
+                Brain.scaled_sprites.clear()
+            Brain.scaled_sprites[(new_w, new_h)] = sprite
+        return sprite
+
+    @classmethod
+    def get_flash_sprite(cls, sprite: pygame.Surface) -> pygame.Surface:
+        """Return the pickup-flash version of a scaled sprite, rendering it once per size."""
+        size = sprite.get_size()
+        flash_sprite = cls.flash_sprites.get(size)
+        if flash_sprite is None:
+            flash_sprite = sprite.copy()
+            # Additive white flash (alpha plays no part in RGB_ADD)
+            flash_sprite.fill((255, 255, 255), special_flags=pygame.BLEND_RGB_ADD)
+            if len(cls.flash_sprites) >= cls.MAX_CACHED_SIZES:
+                cls.flash_sprites.clear()
+            cls.flash_sprites[size] = flash_sprite
+        return flash_sprite
+
+    @classmethod
+    def get_faded_sprite(cls, sprite: pygame.Surface, flashing: bool, alpha: int) -> pygame.Surface:
+        """
+        Return the sprite faded to alpha's quantized step, rendering each step once per size.
+
+        Brains fading through the same step share the surface, so it must not be modified.
+        """
+        step = alpha >> cls.FADE_SHIFT
+        key = (*sprite.get_size(), flashing, step)
+        faded_sprite = cls.faded_sprites.get(key)
+        if faded_sprite is None:
+            faded_sprite = sprite.copy()
+            faded_sprite.set_alpha(step << cls.FADE_SHIFT)
+            if len(cls.faded_sprites) >= cls.MAX_FADED_SPRITES:
+                cls.faded_sprites.clear()
+            cls.faded_sprites[key] = faded_sprite
+        return faded_sprite
 
     # ------------------------------- Rendering ---------------------------------------
     
@@ -121,39 +184,33 @@ class Brain:
         
         return 255  # Fully visible
 
-    ## DEBUG FUNCTION
-    def draw_center_dot(self, surf: pygame.Surface, now_ms: int) -> None:
+    def get_sprite_blit(self, now_ms: int) -> tuple[pygame.Surface, pygame.Rect] | None:
         """
-        Draw a red dot at the center of the brain sprite.
+        Return the (sprite, rect) to blit for the current frame, or None when invisible.
+
+        Lets the game loop batch brains into the same ``Surface.blits`` call as the zombies.
         """
         center = self.spawn.pos
-        dot_radius = 3
-        pygame.draw.circle(surf, (255, 0, 0), (center[0], center[1]), dot_radius)
-    
-    def draw(self, surf: pygame.Surface, now_ms: int) -> None:
-        """Render the brain pickup."""
-        center = self.spawn.pos
         alpha = self.get_alpha(now_ms)
         
         if alpha <= 0:
-            return
+            return None
             
         if Brain.sprites_loaded and hasattr(Brain, 'original_sprite'):
             display_sprite = self.get_scaled_sprite()
-            if alpha < 255:
-                display_sprite.set_alpha(alpha)
             
-            # Add pickup flash effect
-            if self.picked_up and self.pickup_time is not None and now_ms - self.pickup_time < self.PICKUP_FLASH_MS:
-                flash_alpha = int(128 * (1.0 - (now_ms - self.pickup_time) / self.PICKUP_FLASH_MS))
-                flash_surface = pygame.Surface(display_sprite.get_size(), pygame.SRCALPHA)
-                flash_surface.fill((255, 255, 255, flash_alpha))
-                display_sprite.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+            # Add pickup flash effect: swap in the pre-flashed copy of this sprite
+            flashing = self.picked_up and self.pickup_time is not None and now_ms - self.pickup_time < self.PICKUP_FLASH_MS
+            if flashing:
+                display_sprite = self.get_flash_sprite(display_sprite)
+
+            # Fading only lasts a few hundred ms; use the shared copy for this alpha step
+            if alpha < 255:
+                display_sprite = self.get_faded_sprite(display_sprite, flashing, alpha)
             
-            sprite_rect = display_sprite.get_rect(center=center)
-            surf.blit(display_sprite, sprite_rect)
+            return display_sprite, display_sprite.get_rect(center=center)
 
-        # self.draw_center_dot(surf, now_ms)
+        return None
 
     def get_hitbox_rect(self) -> pygame.Rect:
         """
@@ -171,18 +228,14 @@ class Brain:
         hitbox_rect = self.get_hitbox_rect()
         return hitbox_rect.collidepoint(point)
     
-    def draw_hitbox(self, surf: pygame.Surface, now_ms: int) -> None:
+    def hitbox_outline(self, now_ms: int) -> tuple[tuple[int, int, int], pygame.Rect]:
         """
-        Draw the brain's hitbox as a colored rectangle outline for debugging.
+        Return the (color, rect) of the debug hitbox outline without drawing it.
         """
-        hitbox_rect = self.get_hitbox_rect()
         if self.picked_up:
             color = (255, 255, 0)    # Yellow when picked up (not hittable)
         elif self.dead:
             color = (128, 128, 128)  # Gray when dead
         else:
             color = (0, 255, 0)      # Green when hittable
-        # Draw hitbox outline
-        pygame.draw.rect(surf, color, hitbox_rect, 2)
-
-        
\ No newline at end of file
+        return color, self.get_hitbox_rect()
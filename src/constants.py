@@ -7,11 +7,22 @@ import os
 
 WIDTH, HEIGHT = 960, 540
 FPS = 60
+MAX_FRAME_MS = 1000 // 30   # longest frame time fed to timed effects; longer stalls are clamped
+FPS_SAMPLES = 10     # frames averaged for the HUD FPS readout
+GC_INTERVAL_MS = 30_000   # play time between forced gc.collect() calls while automatic GC is off
+DEBUG = False        # verbose console output (resize/relocation traces)
 BG_COLOR = (25, 28, 33)
 TEXT_COLOR = (235, 235, 235)
 HOLE_COLOR = (60, 65, 75)
 HOLE_RING = (30, 33, 40)           # subtle ring for holes
 FLASH_COLOR = (255, 235, 90)
+HAMMER_PARTICLE_COLOR = (255, 255, 100)
+HAMMER_PARTICLE_SIZES = (3, 4, 5, 6)   # diameters with a pre-rendered sprite
+HAMMER_PARTICLES_PER_HIT = 8
+MAX_HAMMER_EFFECTS = 128               # live hammer particles; the oldest are dropped beyond this
+HAMMER_PARTICLE_MAX_LIFE = 120         # ms of life that maps to full opacity
+HAMMER_PARTICLE_GRAVITY = 0.3          # px/frame² added to dy each frame
+PARTICLE_STEP_MS = 16                  # particle life lost per frame (16ms at 60fps)
 HUD_PADDING = 12
 FONT_NAME = "freesansbold.ttf"
 
@@ -35,6 +46,8 @@ MAX_LIFETIME_MS = 2000
 MIN_LIFETIME_MS = 800
 
 SPAWN_INTERVAL_MS = 1000           
+SPAWN_GRID_COLS = 5
+SPAWN_GRID_ROWS = 4
 
 # Level System Settings
 MAX_LEVEL = 10
@@ -0,0 +1,72 @@
+"""Process-wide cache of decoded, display-converted images."""
+
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+_IMAGE_CACHE: dict[tuple[str, bool], pygame.Surface] = {}
+
+PRELOAD_WORKERS = 4
+
+
+def load(path: str, alpha: bool = True) -> pygame.Surface:
+    """
+    Load an image from disk once and return the cached, converted Surface.
+
+    Parameters
+    ----------
+    path : str
+        Path to the image file.
+    alpha : bool, optional
+        Use ``convert_alpha()`` (default) for images with transparency,
+        ``convert()`` for opaque ones.
+
+    Returns
+    -------
+    pygame.Surface
+        Shared Surface in the display's pixel format. Callers scale or copy
+        it rather than drawing onto it.
+    """
+    key = (path, alpha)
+    surface = _IMAGE_CACHE.get(key)
+    if surface is None:
+        image = pygame.image.load(path)
+        surface = image.convert_alpha() if alpha else image.convert()
+        _IMAGE_CACHE[key] = surface
+    return surface
+
+
+def _decode(path: str) -> pygame.Surface | None:
+    """Decode one file off the main thread; failures are left for load() to report."""
+    try:
+        return pygame.image.load(path)
+    except (pygame.error, OSError):
+        return None
+
+
+def preload(images: Iterable[tuple[str, bool]]) -> None:
+    """
+    Decode several images in parallel and cache them for :func:`load`.
+
+    File reading and PNG decoding release the GIL, so they overlap on a small
+    thread pool; the display conversion stays on the calling (main) thread.
+    Missing or undecodable files are skipped, and a later :func:`load` of the
+    same path raises as usual.
+
+    Parameters
+    ----------
+    images : Iterable[tuple[str, bool]]
+        ``(path, alpha)`` pairs, with ``alpha`` as in :func:`load`.
+        Requires the display mode to be set.
+    """
+    pending = [(path, alpha) for path, alpha in images
+               if (path, alpha) not in _IMAGE_CACHE and os.path.exists(path)]
+    if not pending:
+        return
+    with ThreadPoolExecutor(max_workers=min(PRELOAD_WORKERS, len(pending))) as pool:
+        decoded = list(pool.map(_decode, [path for path, _ in pending]))
+    for (path, alpha), image in zip(pending, decoded):
+        if image is not None:
+            _IMAGE_CACHE[(path, alpha)] = image.convert_alpha() if alpha else image.convert()
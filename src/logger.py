@@ -3,7 +3,15 @@
 import datetime
 
 class GameLogger:
-    """Handles logging of game events to markdown file."""
+    """
+    Handles logging of game events to markdown file.
+
+    The file stays open with a large write buffer, so logging a click is an
+    in-memory append; the game calls flush() at natural breaks (pause, level
+    up, game over) and close() on exit.
+    """
+
+    BUFFER_SIZE = 1 << 16   # bytes held before the file object writes through on its own
     
     def __init__(self, log_file: str):
         """
@@ -15,17 +23,20 @@ class GameLogger:
             Path to the log file
         """
         self.log_file = log_file
+        self.file = None
         self.setup_log()
     
     def setup_log(self) -> None:
         """Initialize the log file with headers."""
         try:
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                f.write("# Whack-a-Zombie Game Log\n\n")
-                f.write(f"Log started at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write("## Mouse Click Events\n\n")
-                f.write("| Timestamp | Position (x,y) | Result | Details |\n")
-                f.write("|-----------|---------------|--------|----------|\n")
+            f = open(self.log_file, 'w', encoding='utf-8', buffering=self.BUFFER_SIZE)
+            f.write("# Whack-a-Zombie Game Log\n\n")
+            f.write(f"Log started at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write("## Mouse Click Events\n\n")
+            f.write("| Timestamp | Position (x,y) | Result | Details |\n")
+            f.write("|-----------|---------------|--------|----------|\n")
+            f.flush()   # the header is on disk even if the game never logs an event
+            self.file = f
         except Exception as e:
             print(f"Failed to initialize log file: {e}")
     
@@ -42,12 +53,13 @@ class GameLogger:
         details : str, optional
             Additional details about the click
         """
+        if self.file is None:
+            return
         try:
             timestamp = datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]  # Include milliseconds
             result = "HIT" if hit else "MISS"
             
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"| {timestamp} | ({pos[0]}, {pos[1]}) | {result} | {details} |\n")
+            self.file.write(f"| {timestamp} | ({pos[0]}, {pos[1]}) | {result} | {details} |\n")
                 
         except Exception as e:
             print(f"Failed to log click: {e}")
@@ -61,11 +73,31 @@ class GameLogger:
         level : int
             New level reached
         """
+        if self.file is None:
+            return
         try:
             timestamp = datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]
             
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"| {timestamp} | LEVEL UP | SYSTEM | Reached level {level} |\n")
+            self.file.write(f"| {timestamp} | LEVEL UP | SYSTEM | Reached level {level} |\n")
                 
         except Exception as e:
             print(f"Failed to log level up: {e}")
+
+    def flush(self) -> None:
+        """Write buffered events to disk."""
+        if self.file is None:
+            return
+        try:
+            self.file.flush()
+        except Exception as e:
+            print(f"Failed to flush log file: {e}")
+
+    def close(self) -> None:
+        """Flush and close the log file; later events are dropped."""
+        if self.file is None:
+            return
+        try:
+            self.file.close()
+        except Exception as e:
+            print(f"Failed to close log file: {e}")
+        self.file = None
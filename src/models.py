@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+# eq=False: every spawn point is a distinct tomb, so identity equality and the built-in
+# identity hash are correct, and set/dict lookups skip a Python-level __hash__/__eq__
+@dataclass(frozen=True, eq=False)
 class SpawnPoint:
     """
     A single, fixed spawn location for zombie heads.
@@ -13,7 +15,11 @@ class SpawnPoint:
         The (x, y) center position on the playfield for this spawn point.
     radius : int
         Radius used to draw the hole and approximate the clickable region.
+    index : int
+        Row-major position in the spawn grid; the same tomb keeps its index
+        across window resizes.
     """
     pos: tuple[int, int]
     radius: int
+    index: int
 
@@ -0,0 +1,172 @@
+"""Pre-rendered circle sprites shared by the particle effects."""
+
+import math
+
+import pygame
+
+# Particles fade out in ALPHA_LEVELS discrete steps; alpha >> ALPHA_SHIFT picks the step
+ALPHA_LEVELS = 8
+ALPHA_SHIFT = 5
+
+# Unit vectors for 64 evenly spaced headings, so bursts pick a direction without trig
+DIRECTION_STEPS = 64
+UNIT_DIRECTIONS = tuple(
+    (math.cos(i * 2 * math.pi / DIRECTION_STEPS), math.sin(i * 2 * math.pi / DIRECTION_STEPS))
+    for i in range(DIRECTION_STEPS)
+)
+
+
+def build_particle_atlas(color: tuple[int, int, int], sizes) -> dict[int, list[pygame.Surface]]:
+    """
+    Render one filled circle per (size, alpha level) into a single atlas surface.
+
+    Parameters
+    ----------
+    color : tuple[int, int, int]
+        RGB color of the particles.
+    sizes : Iterable[int]
+        Particle diameters (in pixels) that need a tile.
+
+    Returns
+    -------
+    dict[int, list[pygame.Surface]]
+        Mapping of size to ALPHA_LEVELS subsurface tiles with the alpha baked
+        in, indexed by ``alpha >> ALPHA_SHIFT``. Tiles share the atlas pixels,
+        so the whole set costs a single allocation.
+    """
+    sizes = sorted(sizes)
+    max_size = max(sizes)
+    atlas = pygame.Surface((sum(sizes), max_size * ALPHA_LEVELS), pygame.SRCALPHA).convert_alpha()
+    atlas.fill((0, 0, 0, 0))
+
+    tiles = {}
+    x = 0
+    for size in sizes:
+        half = size // 2
+        tiles[size] = []
+        for level in range(ALPHA_LEVELS):
+            alpha = min(255, (level + 1) << ALPHA_SHIFT)
+            y = level * max_size
+            pygame.draw.circle(atlas, (*color, alpha), (x + half, y + half), half)
+            tiles[size].append(atlas.subsurface((x, y, size, size)))
+        x += size
+    return tiles
+
+
+class ParticleBuffer:
+    """
+    Fading, falling particles stored as parallel lists (one list per attribute).
+
+    Particles move with constant velocity plus constant gravity, so the buffer
+    keeps only each particle's launch state and the step it was emitted on;
+    position and remaining life are evaluated in closed form when the blit
+    list is built. A step is then O(1) except on the few steps where a
+    particle expires and the lists are compacted. Every particle carries its
+    own alpha-level tile list, so one buffer can hold several colors and sizes.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum live particles; emitting beyond it drops the oldest.
+    max_life : int
+        Lifetime (ms) that maps to full opacity.
+    gravity : float
+        Added to each particle's vertical velocity every step.
+    step_ms : int
+        Life lost per step.
+    """
+
+    def __init__(self, capacity: int, max_life: int, gravity: float, step_ms: int) -> None:
+        self.capacity = capacity
+        self.max_life = max_life
+        self.gravity = gravity
+        self.step_ms = step_ms
+        self.steps = 0              # steps taken since the buffer was created
+        self.next_expiry = 0        # earliest step on which a live particle expires
+        self.x: list[float] = []    # tile top-left at emission
+        self.y: list[float] = []
+        self.dx: list[float] = []   # velocity at emission
+        self.dy: list[float] = []
+        self.born: list[int] = []   # step the particle was emitted on
+        self.life: list[int] = []   # lifetime (ms) at emission
+        self.expiry: list[int] = [] # step on which the particle is dropped
+        self.tiles: list[list[pygame.Surface]] = []
+
+    def __len__(self) -> int:
+        return len(self.life)
+
+    def columns(self) -> tuple[list, ...]:
+        """Every per-particle list, in a fixed order."""
+        return (self.x, self.y, self.dx, self.dy, self.born, self.life, self.expiry, self.tiles)
+
+    def emit(self, x: float, y: float, dx: float, dy: float, life: int,
+             tiles: list[pygame.Surface]) -> None:
+        """
+        Add one particle, dropping the oldest when at capacity.
+
+        Parameters
+        ----------
+        tiles : list[pygame.Surface]
+            The particle's ALPHA_LEVELS tiles, i.e. ``atlas[size]`` from
+            :func:`build_particle_atlas`.
+        """
+        if len(self.life) >= self.capacity:
+            for column in self.columns():
+                del column[0]
+        half = tiles[0].get_width() >> 1
+        # Dropped on the first step that would take its life to zero or below
+        expiry = self.steps + (life + self.step_ms - 1) // self.step_ms
+        self.x.append(x - half)
+        self.y.append(y - half)
+        self.dx.append(dx)
+        self.dy.append(dy)
+        self.born.append(self.steps)
+        self.life.append(life)
+        self.expiry.append(expiry)
+        self.tiles.append(tiles)
+        if len(self.expiry) == 1 or expiry < self.next_expiry:
+            self.next_expiry = expiry
+
+    def update(self) -> None:
+        """Advance every particle by one step; drop the expired ones."""
+        if not self.life:
+            return
+        self.steps += 1
+        # Compact only on steps where something expires
+        if self.steps >= self.next_expiry:
+            steps = self.steps
+            columns = self.columns()
+            # Two-pointer compaction in place: survivors slide down over the expired slots,
+            # then the tail is cut once; no replacement lists are allocated
+            kept = 0
+            for i, expiry in enumerate(self.expiry):
+                if expiry > steps:
+                    if i != kept:
+                        for column in columns:
+                            column[kept] = column[i]
+                    kept += 1
+            for column in columns:
+                del column[kept:]
+            if kept:
+                self.next_expiry = min(self.expiry)
+
+    def blit_sequence(self) -> list[tuple[pygame.Surface, tuple[float, float]]]:
+        """Build the ``(tile, dest)`` pairs for ``Surface.blits``."""
+        steps = self.steps
+        step_ms = self.step_ms
+        max_life = self.max_life
+        half_gravity = self.gravity / 2
+        # After n steps: x + n*dx, y + n*dy + g*n*(n-1)/2, life - n*step_ms.
+        # Fade follows remaining life, quantized to the atlas' alpha levels.
+        return [
+            (tiles[(life - n * step_ms) * 255 // max_life >> ALPHA_SHIFT],
+             (x + n * dx, y + n * dy + half_gravity * n * (n - 1)))
+            for x, y, dx, dy, n, life, tiles in zip(
+                self.x, self.y, self.dx, self.dy,
+                [steps - born for born in self.born], self.life, self.tiles)
+        ]
+
+    def translate(self, dx: float, dy: float) -> None:
+        """Shift every particle (e.g. when its emitter is moved after a resize)."""
+        self.x = [x + dx for x in self.x]
+        self.y = [y + dy for y in self.y]
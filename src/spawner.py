@@ -8,7 +8,7 @@ import random
 
 from .constants import (
     SPAWN_INTERVAL_MS, LEVEL_SPAWN_DECREASE, MIN_SPAWN_INTERVAL, MAX_LIFETIME_MS, LEVEL_LIFETIME_DECREASE,
-    BRAIN_SPAWN_CHECK_INTERVAL_MS, BRAIN_SPAWN_PROBABILITY
+    MIN_ZOMBIE_LIFETIME, MAX_LEVEL, BRAIN_SPAWN_CHECK_INTERVAL_MS, BRAIN_SPAWN_PROBABILITY
 )
 from .models import SpawnPoint
 from .zombie import Zombie
@@ -28,6 +28,9 @@ class Spawner:
         self.spawn_points = spawn_points    # list of spawn points
         self.next_spawn_at = 0              # ms timestamp for next spawn
         self.next_brain_check_at = 0        # ms timestamp for next brain spawn check
+        # Level -> (spawn interval, zombie lifetime), computed once for every reachable level
+        self.level_timings = {level: (self.get_spawn_interval(level), self.get_zombie_lifetime(level))
+                              for level in range(1, MAX_LEVEL + 1)}
 
     def update_spawn_points(self, new_spawn_points: list[SpawnPoint]) -> None:
         """Update spawn points when window is resized."""
@@ -39,11 +42,27 @@ class Spawner:
         """
         return max(MIN_SPAWN_INTERVAL, SPAWN_INTERVAL_MS - (level - 1) * LEVEL_SPAWN_DECREASE)
 
+    def get_zombie_lifetime(self, level: int) -> int:
+        """
+        Calculate zombie lifetime (milliseconds) based on level.
+        """
+        # Robustness: ensure lifetime never drops below configured minimum
+        return max(MIN_ZOMBIE_LIFETIME, MAX_LIFETIME_MS - (level - 1) * LEVEL_LIFETIME_DECREASE)
+
+    def level_timing(self, level: int) -> tuple[int, int]:
+        """
+        Return ``(spawn interval, zombie lifetime)`` in ms for a level, from the precomputed table.
+        """
+        timing = self.level_timings.get(level)
+        if timing is None:
+            timing = (self.get_spawn_interval(level), self.get_zombie_lifetime(level))
+        return timing
+
     def schedule_next(self, now_ms: int, level: int) -> None:
         """
         Pick the next spawn time based on level-adjusted cadence with jitter.
         """
-        base_interval = self.get_spawn_interval(level)
+        base_interval = self.level_timing(level)[0]
 
         # add variability to cadence
         # prevent predictable spawns
@@ -51,6 +70,14 @@ class Spawner:
         
         self.next_spawn_at = now_ms + max(200, base_interval + jitter)
 
+    def is_due(self, now_ms: int) -> bool:
+        """
+        Whether a zombie spawn or brain check is due (or not yet scheduled).
+
+        Lets the game loop skip both maybe_spawn calls on the frames in between.
+        """
+        return now_ms >= self.next_spawn_at or now_ms >= self.next_brain_check_at
+
     def get_available_spawn_points(self, zombies: list[Zombie], brains: list[Brain] | None = None) -> list[SpawnPoint]:
         """
         Get spawn points that don't currently have active zombies or brains.
@@ -67,10 +94,10 @@ class Spawner:
         list[SpawnPoint]
             List of spawn points without active entities
         """
+        # Spawn points hash by identity, so these set operations stay in C
         occupied_spawn_points = {zombie.spawn for zombie in zombies if not zombie.dead}
         if brains:
-            brain_spawn_points = {brain.spawn for brain in brains if not brain.dead}
-            occupied_spawn_points.update(brain_spawn_points)
+            occupied_spawn_points.update([brain.spawn for brain in brains if not brain.dead])
         return [sp for sp in self.spawn_points if sp not in occupied_spawn_points]
 
     def maybe_spawn(self, now_ms: int, zombies: list[Zombie], level: int, brains: list[Brain] | None = None) -> None:
@@ -98,11 +125,7 @@ class Spawner:
             # Only spawn if there are available spawn points
             if available_spawns:
                 spawn = random.choice(available_spawns)
-                lifetime = MAX_LIFETIME_MS - (level - 1) * LEVEL_LIFETIME_DECREASE
-                
-                # Robustness: ensure lifetime never drops below configured minimum
-                from .constants import MIN_ZOMBIE_LIFETIME  # local import to avoid cycles
-                lifetime = max(MIN_ZOMBIE_LIFETIME, lifetime)
+                lifetime = self.level_timing(level)[1]
 
                 new_zombie = Zombie(spawn, born_at_ms=now_ms, lifetime_ms=lifetime)
                 new_zombie.create_spawn_particles()  # Create spawn effects
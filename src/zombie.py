@@ -7,12 +7,22 @@ import os
 import pygame
 import random
 
+from . import image_cache
 from .constants import (
     ATTACK_ANIM_MS, 
     ZOMBIE_SPRITE_PATH, 
-    FLASH_COLOR
+    FLASH_COLOR,
+    PARTICLE_STEP_MS
 )
 from .models import SpawnPoint
+from .particles import UNIT_DIRECTIONS, ParticleBuffer, build_particle_atlas
+
+# Sprite sheet layout: SHEET_COLS x SHEET_ROWS equal cells; (col, row) of each animation's frames
+SHEET_COLS, SHEET_ROWS = 11, 12
+NORMAL_CELLS = ((0, 0), (1, 0), (2, 0), (3, 0),
+                (0, 1), (1, 1), (2, 1), (3, 1))
+ATTACK_CELLS = ((4, 2), (5, 2), (6, 2), (7, 2))
+DEATH_CELLS = ((0, 10), (1, 10), (2, 10), (3, 10))
 
 class Zombie:
     """
@@ -27,9 +37,20 @@ class Zombie:
     Timings are driven via pygame.time.get_ticks() (frame-rate independent).
     """
 
+    # Per-instance state lives in fixed slots (no per-zombie __dict__); class-level
+    # constants and the shared sprite frames below are unaffected
+    __slots__ = (
+        "spawn", "born_at", "lifetime", "dead", "hit", "hit_time", "despawn_start",
+        "attacking", "attack_start", "has_dealt_damage", "animation_frame", "wake_at",
+        "rest_hitbox", "bounds_key", "bounds", "spawn_particles", "spawn_dust_alpha",
+        "spawn_glow_alpha", "hit_particles", "hit_flash_timer", "scale_factor",
+        "offset_at", "offset",
+    )
+
     SPAWN_ANIM_MS = 150
     DESPAWN_ANIM_MS = 250
     HIT_FLASH_MS = 150
+    ANIMATION_FRAME_MS = 100    # each animation frame is displayed for 100ms
 
     SPRITE_BASE_W = 80
     SPRITE_BASE_H = 70
@@ -38,20 +59,72 @@ class Zombie:
     ANCHOR_OFFSET_X = -18
     ANCHOR_OFFSET_Y = -6
 
+    ATTACK_BOUNCE_PX = 5    # peak upward offset of the attack bounce
+    EFFECT_REACH_PX = 48    # farthest a spawn/hit particle travels from the spawn point
+
+    DUST_COLOR = (139, 69, 19)                                           # brown spawn dust
+    DUST_SIZES = (3, 4, 5)
+    DUST_PARTICLE_COUNT = 8
+    DUST_MAX_LIFE = 90                                                   # ms of life drawn fully opaque
+    HIT_COLORS = ((255, 100, 100), (255, 200, 100), (255, 255, 100))    # red, orange, yellow
+    HIT_SIZES = (4, 5, 6, 7)
+    HIT_PARTICLE_COUNT = 12
+    HIT_MAX_LIFE = 120
+    HIT_GRAVITY = 0.2                                                    # added to dy every frame
+
     # Class variables for sprite management
     sprite_sheet = None
     normal_frames = []
     attack_frames = []
     death_frames = []
+    death_flash_frames = []     # death_frames with the hit flash baked in, same order
+    # The death/attack (and flashed death) frames padded to len(normal_frames) by holding the
+    # last frame, so every state indexes its list directly with animation_frame
+    death_sequence = []
+    attack_sequence = []
+    death_flash_sequence = []
+    frames_version = 0          # bumped whenever the active frames are swapped or (re)built
+    # Sprite (w, h) -> (normal, attack, death, death_flash) frames already scaled to it, so a
+    # resize back to a size seen before swaps lists instead of rescaling the sheet. Kept in
+    # least-recently-used order and capped, so a resize drag cannot pile up every size it passes
+    frame_sets: dict[tuple[int, int], tuple[list, list, list, list]] = {}
+    MAX_FRAME_SETS = 3
     sprites_loaded = False
 
+    # Pre-rendered particle tiles (size -> alpha level -> Surface), built on first draw
+    dust_tiles = None
+    hit_tiles = None
+    glow_surfaces: dict[int, pygame.Surface] = {}   # glow radius -> full-strength spawn glow
+    scaled_sizes: dict[float, tuple[int, int]] = {}  # scale factor -> _scaled_size() result
+    MAX_SCALED_SIZES = 16   # scaled_sizes is flushed wholesale when full
+    timer_bar_backgrounds: dict[int, pygame.Surface] = {}   # bar width -> empty bar with its border
+
     @classmethod
     def _scaled_size(cls, scale_factor: float = 1.0) -> tuple[int, int]:
         """Return (w, h) used everywhere for this zombie's scaled sprite."""
-        # Apply additional scale factor for responsive sizing
-        responsive_scale = cls.SPRITE_SCALE * scale_factor
-        return (int(cls.SPRITE_BASE_W * responsive_scale),
-                int(cls.SPRITE_BASE_H * responsive_scale))
+        size = cls.scaled_sizes.get(scale_factor)
+        if size is None:
+            # Apply additional scale factor for responsive sizing
+            responsive_scale = cls.SPRITE_SCALE * scale_factor
+            size = (int(cls.SPRITE_BASE_W * responsive_scale),
+                    int(cls.SPRITE_BASE_H * responsive_scale))
+            if len(cls.scaled_sizes) >= cls.MAX_SCALED_SIZES:
+                cls.scaled_sizes.clear()
+            cls.scaled_sizes[scale_factor] = size
+        return size
+
+    @staticmethod
+    def _scale_frame(frame: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Scale one sprite sheet cell to size.
+
+        Shrinking uses smoothscale, which averages the source pixels instead of
+        dropping them; growing keeps the plain scale. Frames are scaled once per
+        size (see frame_sets), so the slower filter costs nothing per frame.
+        """
+        if size[0] < frame.get_width():
+            return pygame.transform.smoothscale(frame, size)
+        return pygame.transform.scale(frame, size)
 
     @classmethod
     def load_sprites(cls):
@@ -62,43 +135,8 @@ class Zombie:
         if os.path.exists(ZOMBIE_SPRITE_PATH):
             try:
                 # Sprite sheet is a PNG image now being organized into 11 columns and 12 rows.
-                cls.sprite_sheet = pygame.image.load(ZOMBIE_SPRITE_PATH).convert_alpha()
-                sheet_width, sheet_height = cls.sprite_sheet.get_size()
-
-                cols, rows = 11, 12
-                sprite_width = sheet_width // cols
-                sprite_height = sheet_height // rows
-                
-                # Desired output size (scaled)
-                out_w, out_h = cls._scaled_size()
-
-                normal_positions = [
-                    (0, 0), (1, 0), (2, 0), (3, 0),
-                    (0, 1), (1, 1), (2, 1), (3, 1),
-                ]
-                attack_positions = [(4, 2), (5, 2), (6, 2), (7, 2)]
-                death_positions = [(0, 10), (1, 10), (2, 10), (3, 10)]
-                for col, row in normal_positions:
-                    x = col * sprite_width
-                    y = row * sprite_height
-                    rect = pygame.Rect(x, y, sprite_width, sprite_height)
-                    frame = cls.sprite_sheet.subsurface(rect)
-                    cls.normal_frames.append(pygame.transform.scale(frame, (out_w, out_h)))
-
-                for col, row in attack_positions:
-                    x = col * sprite_width
-                    y = row * sprite_height
-                    rect = pygame.Rect(x, y, sprite_width, sprite_height)
-                    frame = cls.sprite_sheet.subsurface(rect)
-                    cls.attack_frames.append(pygame.transform.scale(frame, (out_w, out_h)))
-
-                for col, row in death_positions:
-                    x = col * sprite_width
-                    y = row * sprite_height
-                    rect = pygame.Rect(x, y, sprite_width, sprite_height)
-                    frame = cls.sprite_sheet.subsurface(rect)
-                    cls.death_frames.append(pygame.transform.scale(frame, (out_w, out_h)))
-
+                cls.sprite_sheet = image_cache.load(ZOMBIE_SPRITE_PATH)
+                cls._use_frames(cls._scaled_size())
                 cls.sprites_loaded = True
             except Exception as e:
                 print(f"Failed to load sprites: {e}")
@@ -118,14 +156,21 @@ class Zombie:
         self.attack_start: int | None = None
         self.has_dealt_damage = False
         self.animation_frame = 0
+        self.wake_at = 0    # game time before which tick() has nothing to do; 0 = tick every frame
+        self.offset_at: int | None = None   # now_ms that self.offset was computed for; None = stale
+        self.offset = 0
+        self.rest_hitbox = self._build_rest_hitbox()   # rebuilt by move_to()
+        self.bounds_key = None      # (spawn, scale_factor, frames_version) the cached bounds were built for
+        self.bounds: pygame.Rect | None = None
         
         # Spawn effects
-        self.spawn_particles = []
+        self.spawn_particles = ParticleBuffer(self.DUST_PARTICLE_COUNT, self.DUST_MAX_LIFE, 0.0, PARTICLE_STEP_MS)
         self.spawn_dust_alpha = 255
         self.spawn_glow_alpha = 255
         
         # Hit effects
-        self.hit_particles = []
+        self.hit_particles = ParticleBuffer(self.HIT_PARTICLE_COUNT, self.HIT_MAX_LIFE, self.HIT_GRAVITY,
+                                           PARTICLE_STEP_MS)
         self.hit_flash_timer = 0
 
         if not Zombie.sprites_loaded:
@@ -142,6 +187,8 @@ class Zombie:
         self.hit = True
         self.hit_time = now_ms
         self.despawn_start = now_ms
+        self.wake_at = 0    # hit effects animate every frame
+        self.offset_at = None
         
         # Create hit effects at the hit position
         self.create_hit_effects(self.spawn.pos)
@@ -151,50 +198,100 @@ class Zombie:
             return
         self.attacking = True
         self.attack_start = now_ms
+        self.offset_at = None
 
     def is_attacking(self) -> bool:
         return self.attacking and not self.hit and not self.dead
 
     def update(self, now_ms: int) -> bool:
-        attack_occurred = False
+        """
+        Advance the lifecycle state machine by one frame.
+
+        Each state returns as soon as it is handled, so a zombie that is just
+        sitting there costs one comparison against its lifetime.
+
+        Returns
+        -------
+        bool
+            True on the frame the attack animation finishes and damage is dealt.
+        """
+        # zombie is despawning (hit, or finished attacking)
+        # + zombie despawn animation is done
+        # ==> zombie should be die
+        if self.despawn_start is not None:
+            if now_ms - self.despawn_start >= self.DESPAWN_ANIM_MS:
+                self.dead = True
+            return False
 
-        # zombie is not hit by user
+        # zombie is not hit by user (a hit always starts the despawn)
         # + zombie is not attacking
         # + zombie lifetime has expired
-        # + zombie not start despawning
         # ==> start attacking
-        if not self.hit \
-            and not self.attacking \
-            and (now_ms - self.born_at >= self.lifetime) \
-            and self.despawn_start is None:
+        if not self.attacking:
+            if now_ms - self.born_at >= self.lifetime:
                 self.start_attack(now_ms)
+            return False
 
         # zombie is attacking
-        # + zombie attact time is set already 
-        # + zombie has not dealt damage yet
+        # + zombie has not dealt damage yet (dealing damage starts the despawn)
         # + attack animation has finished
         # ==> deal damage and start despawning
-        if self.attacking \
-            and self.attack_start is not None \
-            and not self.has_dealt_damage \
-            and now_ms - self.attack_start >= ATTACK_ANIM_MS:
-                attack_occurred = True
-                self.has_dealt_damage = True
-                self.despawn_start = now_ms
-
-        # zombie is despawning
-        # + zombie despawn animation is done
-        # ==> zombie should be die
-        if self.despawn_start is not None \
-            and now_ms - self.despawn_start >= self.DESPAWN_ANIM_MS:
-                self.dead = True
+        if now_ms - self.attack_start >= ATTACK_ANIM_MS:
+            self.has_dealt_damage = True
+            self.despawn_start = now_ms
+            self.offset_at = None
+            return True
+        return False
+
+    def tick(self, now_ms: int) -> bool:
+        """
+        Advance effects and state for one frame in a single call.
 
+        Fuses update_spawn_effects, update_hit_effects and update; the effect
+        passes are skipped once they have nothing left to animate.
+
+        Returns
+        -------
+        bool
+            True if the zombie finished its attack this frame (see update()).
+        """
+        if self.spawn_particles or now_ms - self.born_at < self.SPAWN_ANIM_MS:
+            self.update_spawn_effects(now_ms)
+        if self.hit_particles or self.hit_flash_timer > 0:
+            self.update_hit_effects(now_ms)
+        attack_occurred = self.update(now_ms)
+
+        # With no effect left to animate, nothing changes until the next state deadline
+        if self.spawn_particles or self.hit_particles or self.hit_flash_timer > 0 \
+                or now_ms - self.born_at < self.SPAWN_ANIM_MS:
+            self.wake_at = 0
+        else:
+            self.wake_at = self.next_state_change()
         return attack_occurred
 
+    def next_state_change(self) -> int:
+        """Game time (ms) at which update() will next change the lifecycle state."""
+        if self.despawn_start is not None:
+            return self.despawn_start + self.DESPAWN_ANIM_MS
+        if self.attacking:
+            return self.attack_start + ATTACK_ANIM_MS
+        return self.born_at + self.lifetime
+
+    def move_to(self, spawn: SpawnPoint) -> None:
+        """Move to another spawn point, carrying in-flight particles along."""
+        dx = spawn.pos[0] - self.spawn.pos[0]
+        dy = spawn.pos[1] - self.spawn.pos[1]
+        self.spawn = spawn
+        self.rest_hitbox = self._build_rest_hitbox()
+        # Particles must stay inside get_draw_bounds() around the new spawn point
+        self.spawn_particles.translate(dx, dy)
+        self.hit_particles.translate(dx, dy)
+
     def update_scale_factor(self, new_scale_factor: float) -> None:
         """Update the zombie's scale factor for responsive sizing."""
         if self.scale_factor != new_scale_factor:
             self.scale_factor = new_scale_factor
+            self.offset_at = None
             # Reload sprites with new scale factor to ensure proper sizing
             self._reload_sprites_with_new_scale()
 
@@ -203,83 +300,122 @@ class Zombie:
         if not Zombie.sprites_loaded or not Zombie.sprite_sheet:
             return
             
-        # Clear existing scaled sprites
-        Zombie.normal_frames.clear()
-        Zombie.attack_frames.clear()
-        Zombie.death_frames.clear()
-        
-        # Get new scaled size
-        out_w, out_h = self._scaled_size(self.scale_factor)
-        
-        # Get Sprite Sheet Dimensions
-        sheet_width, sheet_height = Zombie.sprite_sheet.get_size()
-        cols, rows = 11, 12
-        sprite_width = sheet_width // cols
-        sprite_height = sheet_height // rows
-        
-        # Reload each animation type 
-        # - extract each frame 
-        # - scale it to the new size 
-        # - add to the appropriate frame list 
-
-        # Reload normal frames
-        normal_positions = [
-            (0, 0), (1, 0), (2, 0), (3, 0),
-            (0, 1), (1, 1), (2, 1), (3, 1),
-        ]
-        for col, row in normal_positions:
-            x = col * sprite_width
-            y = row * sprite_height
-            rect = pygame.Rect(x, y, sprite_width, sprite_height)
-            frame = Zombie.sprite_sheet.subsurface(rect)
-            Zombie.normal_frames.append(pygame.transform.scale(frame, (out_w, out_h)))
-        
-        # Reload attack frames
-        attack_positions = [(4, 2), (5, 2), (6, 2), (7, 2)]
-        for col, row in attack_positions:
-            x = col * sprite_width
-            y = row * sprite_height
-            rect = pygame.Rect(x, y, sprite_width, sprite_height)
-            frame = Zombie.sprite_sheet.subsurface(rect)
-            Zombie.attack_frames.append(pygame.transform.scale(frame, (out_w, out_h)))
-        
-        # Reload death frames
-        death_positions = [(0, 10), (1, 10), (2, 10), (3, 10)]
-        for col, row in death_positions:
-            x = col * sprite_width
-            y = row * sprite_height
-            rect = pygame.Rect(x, y, sprite_width, sprite_height)
-            frame = Zombie.sprite_sheet.subsurface(rect)
-            Zombie.death_frames.append(pygame.transform.scale(frame, (out_w, out_h)))
+        # Frames already built at this size are reused as they are
+        Zombie._use_frames(self._scaled_size(self.scale_factor))
+
+    @classmethod
+    def _use_frames(cls, size: tuple[int, int]) -> None:
+        """Make the frames scaled to size the active set, cutting them from the sheet on first use."""
+        # Popped and re-inserted so the dict stays in least-recently-used order
+        frame_set = cls.frame_sets.pop(size, None)
+        if frame_set is not None:
+            cls.frame_sets[size] = frame_set
+            cls.normal_frames, cls.attack_frames, cls.death_frames, cls.death_flash_frames = frame_set
+            cls._index_frames()
+            return
+
+        # Fresh lists: the current ones stay cached under their own size
+        sheet_width, sheet_height = cls.sprite_sheet.get_size()
+        cell_w = sheet_width // SHEET_COLS
+        cell_h = sheet_height // SHEET_ROWS
+        cls.normal_frames, cls.attack_frames, cls.death_frames = (
+            [cls._scale_frame(cls.sprite_sheet.subsurface((col * cell_w, row * cell_h, cell_w, cell_h)), size)
+             for col, row in cells]
+            for cells in (NORMAL_CELLS, ATTACK_CELLS, DEATH_CELLS)
+        )
+        cls._build_flash_frames()
+        cls.frame_sets[size] = (cls.normal_frames, cls.attack_frames,
+                                cls.death_frames, cls.death_flash_frames)
+        # Drop the least recently used sizes; the set just built is the newest entry
+        while len(cls.frame_sets) > cls.MAX_FRAME_SETS:
+            del cls.frame_sets[next(iter(cls.frame_sets))]
+
+    @classmethod
+    def _build_flash_frames(cls) -> None:
+        """Pre-render the hit-flash look of each death frame (flashes only show while hit)."""
+        cls.death_flash_frames = []
+        for frame in cls.death_frames:
+            flash_frame = frame.copy()
+            # Additive blending adds the full color (alpha plays no part in RGB_ADD)
+            flash_frame.fill(FLASH_COLOR, special_flags=pygame.BLEND_RGB_ADD)
+            cls.death_flash_frames.append(flash_frame)
+        cls._index_frames()
+
+    @classmethod
+    def _index_frames(cls) -> None:
+        """Rebuild what is derived from the active frame lists; call after they change."""
+        # Cached draw bounds key on this
+        cls.frames_version += 1
+
+        # One list per state, indexed by animation_frame without clamping
+        sequence_len = max(1, len(cls.normal_frames))
+        cls.death_sequence = cls._hold_last_frame(cls.death_frames, sequence_len)
+        cls.attack_sequence = cls._hold_last_frame(cls.attack_frames, sequence_len)
+        cls.death_flash_sequence = cls._hold_last_frame(cls.death_flash_frames, sequence_len)
+
+    @staticmethod
+    def _hold_last_frame(frames: list[pygame.Surface], length: int) -> list[pygame.Surface]:
+        """Return frames padded (or cut) to length, repeating the last frame; empty stays empty."""
+        if not frames:
+            return []
+        return [frames[min(i, len(frames) - 1)] for i in range(length)]
+
+    @classmethod
+    def glow_surface(cls, glow_radius: int) -> pygame.Surface:
+        """
+        Return the spawn glow for this radius at full strength, rendering it once.
+
+        Callers fade it with ``set_alpha`` instead of redrawing the layers.
+        """
+        glow_surf = cls.glow_surfaces.get(glow_radius)
+        if glow_surf is None:
+            # Create glow surface (square surface for circle)
+            glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA).convert_alpha()
+            glow_surf.fill((0, 0, 0, 0))
+            # Draw multiple concentric circles for layered glow effect
+            for i in range(3):
+                # Calculate alpha for this layer (decreases with each layer)
+                alpha = 255 // (3 * (i + 1))
+                # Calculate radius for this layer (decreases by 5 pixels each layer)
+                radius = glow_radius - i * 5
+                if radius > 0:
+                    # Draw circle centered on the glow surface (yellow with calculated alpha)
+                    pygame.draw.circle(glow_surf, (255, 255, 0, alpha), (glow_radius, glow_radius), radius)
+            cls.glow_surfaces[glow_radius] = glow_surf
+        return glow_surf
+
+    @classmethod
+    def particle_tiles(cls) -> tuple[dict, dict]:
+        """
+        Return the shared (dust, hit) particle tiles, rendering them on first use.
+
+        Returns
+        -------
+        tuple[dict, dict]
+            Dust tiles as ``size -> [Surface per alpha level]`` and hit tiles
+            as ``color -> size -> [Surface per alpha level]``.
+        """
+        if cls.dust_tiles is None:
+            cls.dust_tiles = build_particle_atlas(cls.DUST_COLOR, cls.DUST_SIZES)
+            cls.hit_tiles = {color: build_particle_atlas(color, cls.HIT_SIZES) for color in cls.HIT_COLORS}
+        return cls.dust_tiles, cls.hit_tiles
 
     def create_hit_effects(self, hit_pos: tuple[int, int]) -> None:
         """Create particle effects when zombie is hit."""
         
+        emit = self.hit_particles.emit
+        tiles_by_color = Zombie.particle_tiles()[1]
+        rand = random.random
+        x, y = hit_pos
+
         # Create impact particles
-        for _ in range(12):
-            # Generate random direction (0 to 2π radians = full circle)
-            angle = random.uniform(0, 2 * math.pi)
-            # Random speed between 1-3 pixels per frame for visible movement
-            speed = random.uniform(1, 3)  # Reduced speed for better visibility
-            
-            # Calculate velocity components using trigonometry
-            dx = math.cos(angle) * speed  # Horizontal velocity
-            dy = math.sin(angle) * speed  # Vertical velocity
-            
-            # Create particle dictionary with all necessary properties
-            particle = {
-                'x': hit_pos[0],      # Starting X position (hit location)
-                'y': hit_pos[1],      # Starting Y position (hit location)
-                'dx': dx,             # Horizontal velocity per frame
-                'dy': dy,             # Vertical velocity per frame
-                'life': random.randint(80, 120),  # Random lifetime (80-120 frames)
-                'max_life': 120,      # Maximum lifetime for alpha calculation
-                'alpha': 255,         # Starting alpha (fully opaque)
-                'size': random.randint(4, 7),  # Random particle size (4-7 pixels)
-                # Random color selection: red, orange, or yellow
-                'color': random.choice([(255, 100, 100), (255, 200, 100), (255, 255, 100)])
-            }
-            self.hit_particles.append(particle)
+        for _ in range(self.HIT_PARTICLE_COUNT):
+            # Heading from the precomputed unit-vector table; speed 1-3 pixels per frame
+            ux, uy = random.choice(UNIT_DIRECTIONS)
+            speed = 1 + 2 * rand()
+            # Lifetime 80-120 ms; random red, orange or yellow circle of 4-7 pixels
+            emit(x, y, ux * speed, uy * speed, 80 + int(41 * rand()),
+                 tiles_by_color[random.choice(self.HIT_COLORS)][random.choice(self.HIT_SIZES)])
         
         # Set hit flash timer for screen flash effect (150ms duration)
         self.hit_flash_timer = 150
@@ -288,80 +424,10 @@ class Zombie:
         """Update hit particle effects."""
         # Update hit flash timer
         if self.hit_flash_timer > 0:
-            self.hit_flash_timer -= 16  # 16ms per frame at 60fps
-        
-        # Update each hit particle (use [:] to avoid modification during iteration)
-        for particle in self.hit_particles[:]:
-            # Decrease particle lifetime
-            particle['life'] -= 16  # 16ms per frame at 60fps
-            
-            # Remove dead particles from the list
-            if particle['life'] <= 0:
-                self.hit_particles.remove(particle)
-            else:
-                # Move particles based on their velocity
-                particle['x'] += particle['dx']  # Update X position
-                particle['y'] += particle['dy']  # Update Y position
-                
-                # Calculate alpha based on remaining lifetime (fade out effect)
-                particle['alpha'] = int(255 * (particle['life'] / particle['max_life']))
-                
-                # Add gravity effect (particles fall down over time)
-                particle['dy'] += 0.2  # Increase downward velocity each frame
-
-    def draw_spawn_effects(self, surf: pygame.Surface) -> None:
-        """Draw spawn particle effects and glow."""
-        # Draw dust particles
-        for particle in self.spawn_particles:
-            # Only draw visible particles
-            if particle['alpha'] > 0:
-                # Create a surface for each particle with alpha support
-                particle_surf = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
-                # Brown dust color with current alpha value
-                particle_color = (139, 69, 19, particle['alpha'])  # Brown dust color
-                # Draw circle particle centered on the surface
-                pygame.draw.circle(particle_surf, particle_color, (particle['size']//2, particle['size']//2), particle['size']//2)
-                # Blit particle to main surface at correct position
-                surf.blit(particle_surf, (particle['x'] - particle['size']//2, particle['y'] - particle['size']//2))
+            self.hit_flash_timer -= PARTICLE_STEP_MS  # fixed step, like the particles
         
-        # Draw spawn glow effect
-        if self.spawn_glow_alpha > 0:
-            center_x, center_y = self.spawn.pos
-            # Glow radius is 1.5x the spawn point radius
-            glow_radius = int(self.spawn.radius * 1.5)
-            
-            # Create glow surface (square surface for circle)
-            glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            # Base glow color (yellow with reduced alpha)
-            glow_color = (255, 255, 0, self.spawn_glow_alpha // 3)  # Yellow glow
-            
-            # Draw multiple concentric circles for layered glow effect
-            for i in range(3):
-                # Calculate alpha for this layer (decreases with each layer)
-                alpha = self.spawn_glow_alpha // (3 * (i + 1))
-                # Calculate radius for this layer (decreases by 5 pixels each layer)
-                radius = glow_radius - i * 5
-                if radius > 0:  
-                    glow_color = (255, 255, 0, alpha)  # Yellow with calculated alpha
-                    # Draw circle centered on the glow surface
-                    pygame.draw.circle(glow_surf, glow_color, (glow_radius, glow_radius), radius)
-            
-            # Blit the entire glow effect to the main surface
-            surf.blit(glow_surf, (center_x - glow_radius, center_y - glow_radius))
-
-    def draw_hit_effects(self, surf: pygame.Surface) -> None:
-        """Draw hit particle effects."""
-        # Draw hit particles
-        for particle in self.hit_particles:
-            if particle['alpha'] > 0:
-                # Create a surface for each particle with alpha support
-                particle_surf = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
-                # Combine particle color with current alpha value
-                particle_color = (*particle['color'], particle['alpha'])
-                # Draw circle particle centered on the surface
-                pygame.draw.circle(particle_surf, particle_color, (particle['size']//2, particle['size']//2), particle['size']//2)
-                # Blit particle to main surface at correct position
-                surf.blit(particle_surf, (particle['x'] - particle['size']//2, particle['y'] - particle['size']//2))
+        # Age, move and pull down every particle; expired ones are compacted out
+        self.hit_particles.update()
 
     def update_spawn_effects(self, now_ms: int) -> None:
         """Update spawn particle effects and glow."""
@@ -373,50 +439,25 @@ class Zombie:
             self.spawn_dust_alpha = int(255 * (1 - progress))
             self.spawn_glow_alpha = int(255 * (1 - progress))
         
-        # Update each spawn particle (use [:] to avoid modification during iteration)
-        for particle in self.spawn_particles[:]:
-            # Decrease particle lifetime
-            particle['life'] -= 16  # 16ms per frame at 60fps
-            
-            # Remove dead particles from the list
-            if particle['life'] <= 0:
-                self.spawn_particles.remove(particle)
-            else:
-                # Move particles outward from spawn point
-                particle['x'] += particle['dx']  # Update X position
-                particle['y'] += particle['dy']  # Update Y position
-                
-                # Calculate alpha based on remaining lifetime (fade out effect)
-                particle['alpha'] = int(255 * (particle['life'] / particle['max_life']))
+        # Age and move every dust particle outward; expired ones are compacted out
+        self.spawn_particles.update()
 
     def create_spawn_particles(self) -> None:
         """Create particle effects for zombie spawning."""
         
+        emit = self.spawn_particles.emit
+        tiles = Zombie.particle_tiles()[0]
+        rand = random.random
         center_x, center_y = self.spawn.pos
         
-        # Create 8 dust particles for spawn effect
-        for _ in range(8):
-            # Generate random direction (0 to 2π radians = full circle)
-            angle = random.uniform(0, 2 * math.pi)
-            # Random speed between 0.5-1.5 pixels per frame for gentle movement
-            speed = random.uniform(0.5, 1.5)  # Reduced speed for better visibility
-            
-            # Calculate velocity components using trigonometry
-            dx = math.cos(angle) * speed  # Horizontal velocity
-            dy = math.sin(angle) * speed  # Vertical velocity
-            
-            # Create particle dictionary with all necessary properties
-            particle = {
-                'x': center_x,      # Starting X position (spawn center)
-                'y': center_y,      # Starting Y position (spawn center)
-                'dx': dx,           # Horizontal velocity per frame
-                'dy': dy,           # Vertical velocity per frame
-                'life': random.randint(60, 90),  # Random lifetime (60-90 frames)
-                'max_life': 90,     # Maximum lifetime for alpha calculation
-                'alpha': 255,       # Starting alpha (fully opaque)
-                'size': random.randint(3, 5)  # Random particle size (3-5 pixels)
-            }
-            self.spawn_particles.append(particle)
+        # Create dust particles for spawn effect
+        for _ in range(self.DUST_PARTICLE_COUNT):
+            # Heading from the precomputed unit-vector table; gentle 0.5-1.5 pixels per frame
+            ux, uy = random.choice(UNIT_DIRECTIONS)
+            speed = 0.5 + rand()
+            # Lifetime 60-90 ms; random brown circle of 3-5 pixels
+            emit(center_x, center_y, ux * speed, uy * speed, 60 + int(31 * rand()),
+                 tiles[random.choice(self.DUST_SIZES)])
 
     # ------------------------------- Rendering ---------------------------------------
 
@@ -424,7 +465,17 @@ class Zombie:
         """
         Positive values = zombie is below ground, 0 = fully emerged.
         Uses scaled sprite height so rise/sink matches visual size.
+
+        Memoized per now_ms, so the sprite, the hitbox outline and click tests
+        of one frame share a single evaluation. State and scale changes clear it.
         """
+        if now_ms != self.offset_at:
+            self.offset = self._compute_vertical_offset(now_ms)
+            self.offset_at = now_ms
+        return self.offset
+
+    def _compute_vertical_offset(self, now_ms: int) -> int:
+        """Evaluate the rise/bounce/sink offset returned by get_vertical_offset()."""
         # Get current sprite height for proper scaling
         _, sprite_height = self._scaled_size(self.scale_factor)
 
@@ -444,7 +495,7 @@ class Zombie:
             t = (now_ms - self.attack_start) / ATTACK_ANIM_MS
             if t < 1.0:
                 # Create bouncing effect using sine wave (6 cycles)
-                bounce_offset = int(5 * math.sin(t * math.pi * 6))
+                bounce_offset = int(self.ATTACK_BOUNCE_PX * math.sin(t * math.pi * 6))
                 return -bounce_offset  # Negative = above normal position
 
         # Despawn animation: zombie sinks back underground
@@ -466,24 +517,20 @@ class Zombie:
         if not self.sprites_loaded or not (self.normal_frames or self.attack_frames or self.death_frames):
             return None
 
-        # Frame duration: each frame is displayed for 100ms
-        frame_duration = 100
+        normal_frames = self.normal_frames
         # Calculate current animation frame based on time
-        self.animation_frame = (now_ms // frame_duration) % max(1, len(self.normal_frames))
+        self.animation_frame = frame_idx = (now_ms // self.ANIMATION_FRAME_MS) % max(1, len(normal_frames))
 
-        # Priority order: death > attack > normal
-        if self.hit and self.death_frames:
+        # Priority order: death > attack > normal. The sequences are pre-padded, so no clamping here
+        if self.hit and self.death_sequence:
             # Zombie is hit - show death animation
-            frame_idx = min(self.animation_frame, len(self.death_frames) - 1)
-            return self.death_frames[frame_idx]
-        if self.attacking and self.attack_frames:
+            return self.death_sequence[frame_idx]
+        if self.attacking and self.attack_sequence:
             # Zombie is attacking - show attack animation
-            frame_idx = min(self.animation_frame, len(self.attack_frames) - 1)
-            return self.attack_frames[frame_idx]
-        if self.normal_frames:
+            return self.attack_sequence[frame_idx]
+        if normal_frames:
             # Normal state - show idle animation (cycles through frames)
-            frame_idx = self.animation_frame % len(self.normal_frames)
-            return self.normal_frames[frame_idx]
+            return normal_frames[frame_idx]
         return None
 
     def draw_timer_bar(self, surf: pygame.Surface, now_ms: int) -> None:
@@ -503,8 +550,8 @@ class Zombie:
         bar_x = center_x - bar_width // 2  # Center horizontally
         bar_y = center_y - self.spawn.radius - 15  # Position above spawn point
 
-        # Draw background bar (dark gray)
-        pygame.draw.rect(surf, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
+        # Background and border are the same for every bar of this width: blit the pre-rendered copy
+        surf.blit(Zombie.timer_bar_background(bar_width, bar_height), (bar_x, bar_y))
 
         # Calculate filled width based on progress
         filled_width = int(bar_width * progress)
@@ -517,78 +564,135 @@ class Zombie:
         else:
             color = (255, 0, 0)      # Red: <30% time remaining
 
-        # Draw filled portion of the bar
-        if filled_width > 0:
-            pygame.draw.rect(surf, color, (bar_x, bar_y, filled_width, bar_height))
+        # Draw filled portion of the bar, inside the 1px border (which is drawn over the fill)
+        inner_width = min(filled_width, bar_width - 1) - 1
+        if inner_width > 0:
+            surf.fill(color, (bar_x + 1, bar_y + 1, inner_width, bar_height - 2))
 
-        # Draw border outline (light gray)
-        pygame.draw.rect(surf, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 1)
+    @classmethod
+    def timer_bar_background(cls, bar_width: int, bar_height: int) -> pygame.Surface:
+        """Return the empty timer bar (dark gray with a light gray outline), rendering it once per width."""
+        background = cls.timer_bar_backgrounds.get(bar_width)
+        if background is None:
+            background = pygame.Surface((bar_width, bar_height)).convert()
+            background.fill((50, 50, 50))
+            pygame.draw.rect(background, (200, 200, 200), background.get_rect(), 1)
+            cls.timer_bar_backgrounds[bar_width] = background
+        return background
+
+    def effect_blits(self) -> list[tuple[pygame.Surface, tuple[float, float]]]:
+        """
+        Return the (surface, dest) pairs for the dust, spawn glow and hit particles, in draw order.
 
-    ## DEBUG FUNCTION
-    def draw_center_dot(self, surf: pygame.Surface, now_ms: int) -> None:
+        Built as one sequence for a single ``Surface.blits`` call. The glow surface
+        is shared by every zombie with the same radius, so blit the list before
+        asking another zombie for its own.
         """
-        Draw a red dot at the center of the zombie sprite.
+        # Dust particles: pre-rendered brown circles with the alpha quantized and baked in
+        blit_list = self.spawn_particles.blit_sequence() if self.spawn_particles else []
+        if self.spawn_glow_alpha > 0:
+            center_x, center_y = self.spawn.pos
+            # Glow radius is 1.5x the spawn point radius
+            glow_radius = int(self.spawn.radius * 1.5)
+            glow_surf = Zombie.glow_surface(glow_radius)
+            # The fade is a surface-wide alpha on top of the baked per-pixel layers
+            glow_surf.set_alpha(self.spawn_glow_alpha)
+            blit_list.append((glow_surf, (center_x - glow_radius, center_y - glow_radius)))
+        if self.hit_particles:     # explosion particles; the dirty area comes from get_draw_bounds()
+            blit_list += self.hit_particles.blit_sequence()
+        return blit_list
+
+    def draw_effects(self, surf: pygame.Surface, now_ms: int) -> None:
+        """Draw everything that sits behind the sprite: particles, glow and the timer bar."""
+        # Dust, glow and explosion particles in one call
+        effects = self.effect_blits()
+        if effects:
+            surf.blits(effects, False)
+        self.draw_timer_bar(surf, now_ms)       # Lifetime indicator
+
+    def get_sprite_blit(self, now_ms: int) -> tuple[pygame.Surface, pygame.Rect] | None:
+        """
+        Return the (sprite, rect) to blit for the current frame, or None.
+
+        Kept separate from drawing so callers can batch several zombies into a
+        single ``Surface.blits`` call.
         """
+        # Get current sprite frame based on zombie state
+        sprite = self.get_current_sprite(now_ms)
+        if not (sprite and self.sprites_loaded):
+            return None
+        display_sprite = sprite
+        
+        # Apply hit flash effect if zombie was recently hit: swap in the pre-flashed copy
+        # of the current death frame (built with the frames, so no per-frame copy/fill)
+        if (self.hit and self.hit_time is not None and now_ms - self.hit_time < self.HIT_FLASH_MS
+                and self.death_flash_sequence):
+            display_sprite = self.death_flash_sequence[self.animation_frame]
+
+        # Position sprite with proper offsets
         center = self.spawn.pos
         vertical_offset = self.get_vertical_offset(now_ms)
-        dot_radius = 3
-        pygame.draw.circle(surf, (255, 0, 0), (center[0], center[1] + vertical_offset), dot_radius)
+        sprite_rect = display_sprite.get_rect()
+        sprite_rect.centerx = center[0] + self.ANCHOR_OFFSET_X                      # Horizontal positioning
+        sprite_rect.centery = center[1] + vertical_offset + self.ANCHOR_OFFSET_Y    # Vertical positioning
+        return display_sprite, sprite_rect
 
-    def draw(self, surf: pygame.Surface, now_ms: int) -> None:
+    def get_draw_bounds(self) -> pygame.Rect:
         """
-        Render using sprites with vertical offset for rise/fall animations.
+        Conservative screen area this zombie can touch at any point of its lifecycle.
+
+        Covers the sprite at every rise/sink/bounce offset, the hitbox outline,
+        the timer bar, the spawn glow and the particle spread around the spawn point,
+        so the same rect can be used to erase and present the zombie every frame.
+        The rect only changes with the spawn point or sprite size, so it is cached;
+        callers must not modify it.
         """
-        center = self.spawn.pos
-        vertical_offset = self.get_vertical_offset(now_ms)
-        
-        # Draw background effects first (behind zombie)
-        self.draw_spawn_effects(surf)           # Dust particles and glow
-        self.draw_hit_effects(surf)             # Explosion particles
-        self.draw_timer_bar(surf, now_ms)       # Lifetime indicator
-        # self.draw_center_dot(surf, now_ms)    # Debug center point
+        key = (self.spawn, self.scale_factor, Zombie.frames_version)
+        if key != self.bounds_key:
+            self.bounds = self._build_draw_bounds()
+            self.bounds_key = key
+        return self.bounds
+
+    def _build_draw_bounds(self) -> pygame.Rect:
+        """Compute the rect returned by get_draw_bounds()."""
+        center_x, center_y = self.spawn.pos
 
-        # Get current sprite frame based on zombie state
-        sprite = self.get_current_sprite(now_ms)
-        if sprite and self.sprites_loaded:
-            display_sprite = sprite
-            
-            # Apply hit flash effect if zombie was recently hit
-            if self.hit and self.hit_time is not None and now_ms - self.hit_time < self.HIT_FLASH_MS:
-                # Create a copy of the sprite for flash effect
-                flash_sprite = sprite.copy()
-                # Calculate flash alpha (fades out over time)
-                flash_alpha = int(180 * (1.0 - (now_ms - self.hit_time) / self.HIT_FLASH_MS))
-                # Create flash surface with the flash color
-                flash_surface = pygame.Surface(flash_sprite.get_size(), pygame.SRCALPHA)
-                flash_surface.fill((*FLASH_COLOR, flash_alpha))
-                # Apply flash effect using additive blending
-                flash_sprite.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_ADD)
-                display_sprite = flash_sprite
-
-            # Position sprite with proper offsets
-            sprite_rect = display_sprite.get_rect()
-            sprite_rect.centerx = center[0] + self.ANCHOR_OFFSET_X                      # Horizontal positioning
-            sprite_rect.centery = center[1] + vertical_offset + self.ANCHOR_OFFSET_Y    # Vertical positioning
-            
-            # Draw the final sprite to the surface
-            surf.blit(display_sprite, sprite_rect)
-            return
+        # Frames are shared class-wide and may be scaled differently from this zombie
+        w, h = self._scaled_size(self.scale_factor)
+        base_w, base_h = self._scaled_size()
+        w, h = max(w, base_w), max(h, base_h)
+        if self.normal_frames:
+            frame_w, frame_h = self.normal_frames[0].get_size()
+            w, h = max(w, frame_w), max(h, frame_h)
+
+        # Sprite spans from the top of the attack bounce down to fully sunk (offset = h)
+        sprite_top = center_y + self.ANCHOR_OFFSET_Y - h // 2 - self.ATTACK_BOUNCE_PX
+        sprite_bottom = center_y + self.ANCHOR_OFFSET_Y + h + h // 2
+        bounds = pygame.Rect(center_x - w // 2 + min(0, self.ANCHOR_OFFSET_X), sprite_top,
+                             w + abs(self.ANCHOR_OFFSET_X), sprite_bottom - sprite_top)
+
+        # Glow, particles and the timer bar all stay within a box around the spawn point
+        reach = max(self.EFFECT_REACH_PX, int(self.spawn.radius * 1.5), self.spawn.radius + 15)
+        bounds.union_ip(pygame.Rect(center_x - reach, center_y - reach, reach * 2, reach * 2))
+        return bounds.inflate(4, 4)
 
     def get_hitbox_rect(self, now_ms: int) -> pygame.Rect:
         """
         Calculate the zombie's hitbox rectangle based on current position and sprite size.
         Uses the exact same positioning logic as sprite drawing for consistency.
         """
-        center = self.spawn.pos
-        vertical_offset = self.get_vertical_offset(now_ms)
+        # The fully emerged hitbox, shifted down by the rise/sink offset
+        return self.rest_hitbox.move(0, self.get_vertical_offset(now_ms))
+
+    def _build_rest_hitbox(self) -> pygame.Rect:
+        """Hitbox with the zombie fully emerged at its spawn point."""
         sprite_width, sprite_height = self._scaled_size()
         
         # Create hitbox that's smaller than the sprite (50% width, 90% height)
         hitbox_rect = pygame.Rect(0, 0, int(sprite_width * 0.5), int(sprite_height * 0.9))
         
-        # Center the hitbox horizontally and position it with vertical offset
-        hitbox_rect.centerx = center[0]
-        hitbox_rect.centery = center[1] + vertical_offset
+        # Center the hitbox on the spawn point
+        hitbox_rect.center = self.spawn.pos
         return hitbox_rect
 
     def contains_point(self, point: tuple[int, int], now_ms: int) -> bool:
@@ -602,12 +706,10 @@ class Zombie:
         hitbox_rect = self.get_hitbox_rect(now_ms)
         return hitbox_rect.collidepoint(point)
     
-    def draw_hitbox(self, surf: pygame.Surface, now_ms: int) -> None:
+    def hitbox_outline(self, now_ms: int) -> tuple[tuple[int, int, int], pygame.Rect]:
         """
-        Draw the zombie's hitbox as a colored rectangle outline for debugging.
+        Return the (color, rect) of the debug hitbox outline without drawing it.
         """
-        hitbox_rect = self.get_hitbox_rect(now_ms)
-        
         # Choose color based on zombie state
         if self.attacking:
             color = (255, 0, 0)      # Red when attacking (not hittable)
@@ -615,6 +717,4 @@ class Zombie:
             color = (128, 128, 128)  # Gray when hit
         else:
             color = (0, 255, 0)      # Green when hittable
-            
-        # Draw hitbox outline with 2-pixel thickness
-        pygame.draw.rect(surf, color, hitbox_rect, 2)
+        return color, self.get_hitbox_rect(now_ms)
@@ -8,6 +8,31 @@ from src.constants import (
     MAX_LEVEL, ZOMBIES_PER_LEVEL, FONT_NAME,
     FONT_SIZE_SMALL, BRAIN_PATH
 )
+from src import image_cache
+
+class TextCache:
+    """Memoizes rendered text surfaces keyed by (font, text, color)."""
+
+    MAX_ENTRIES = 256   # flushed wholesale when full; HUD strings change slowly
+
+    def __init__(self) -> None:
+        self.surfaces: dict[tuple[int, str, tuple[int, int, int]], pygame.Surface] = {}
+
+    def render(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Return the antialiased rendering of text, rasterizing it only on a cache miss."""
+        key = (id(font), text, color)
+        surf = self.surfaces.get(key)
+        if surf is None:
+            if len(self.surfaces) >= self.MAX_ENTRIES:
+                self.surfaces.clear()
+            surf = font.render(text, True, color)
+            self.surfaces[key] = surf
+        return surf
+
+    def clear(self) -> None:
+        """Drop all cached surfaces (call when fonts are replaced)."""
+        self.surfaces.clear()
+
 
 class HUD:
     """Heads-Up Display with left/right split layout."""
@@ -16,10 +41,16 @@ class HUD:
         self.font = font
         self.small_font = pygame.font.Font(FONT_NAME, FONT_SIZE_SMALL)
         self.brain_icon = self.load_brain_icon()
+        self.text_cache = TextCache()
+        # Blit list from the last layout and the values it was built for
+        self.layout: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self.layout_key = None
     
     def update_fonts(self, new_font: pygame.font.Font) -> None:
         """Update fonts for responsive scaling."""
         self.font = new_font
+        self.text_cache.clear()
+        self.layout_key = None
         
     def update_brain_icon_scaling(self, scale_factor: float) -> None:
         """Update brain icon size for responsive scaling."""
@@ -28,12 +59,13 @@ class HUD:
             base_size = 20
             new_size = max(16, int(base_size * scale_factor))
             self.brain_icon = pygame.transform.scale(self.original_brain_icon, (new_size, new_size))
+            self.layout_key = None
         
     def load_brain_icon(self) -> pygame.Surface | None:
         """Load brain icon for lives display."""
         if os.path.exists(BRAIN_PATH):
             try:
-                brain_img = pygame.image.load(BRAIN_PATH).convert_alpha()
+                brain_img = image_cache.load(BRAIN_PATH)
                 # Store original for responsive scaling
                 self.original_brain_icon = brain_img
                 # Scale to small icon size (20x20)
@@ -44,97 +76,112 @@ class HUD:
 
     def draw(self, surf: pygame.Surface, hits: int, misses: int, lives: int, 
              level: int, show_fps: bool = False, fps: float = 0.0, 
-             paused: bool = False, muted: bool = False) -> None:
-        """Render a comprehensive HUD with left/right split layout."""
+             paused: bool = False, muted: bool = False) -> list[pygame.Rect]:
+        """
+        Render a comprehensive HUD with left/right split layout.
+
+        The layout is rebuilt only when a displayed value changes; otherwise
+        the previous frame's surfaces and positions are blitted again.
+
+        Returns the rects of everything drawn so the caller can erase and
+        present just those areas.
+        """
+        current_width, current_height = surf.get_size()
+        if show_fps:
+            fps_color = (0, 255, 0) if fps >= 55 else (255, 255, 0) if fps >= 30 else (255, 0, 0)
+            # Whole frames only: a tenths digit changes nearly every frame and would force a
+            # relayout (and a new cached rendering) each time
+            fps_line = (f"FPS: {fps:.0f}", fps_color)
+        else:
+            fps_line = None
+
+        key = (hits, misses, lives, level, fps_line, muted, current_width, current_height)
+        if key != self.layout_key:
+            self.layout = self.build_layout(current_width, current_height, hits, misses,
+                                            lives, level, fps_line, muted)
+            self.layout_key = key
+        dirty = surf.blits(self.layout)
+
+        if paused:
+            pause_text = self.text_cache.render(self.font, "PAUSED", (255, 255, 100))
+            # Responsive positioning - scale based on window height
+            pause_y = max(80, int(current_height * 0.15))  # 15% from top, minimum 80px
+            text_rect = pause_text.get_rect(center=(current_width//2, pause_y))
+            # Semi-transparent background: darken the area in place (same as 50% black) instead of
+            # allocating an SRCALPHA surface each frame
+            bg_rect = text_rect.inflate(20, 10)
+            dirty.append(surf.fill((128, 128, 128), bg_rect, special_flags=pygame.BLEND_RGB_MULT))
+            dirty.append(surf.blit(pause_text, text_rect))
+
+        return dirty
+
+    def build_layout(self, current_width: int, current_height: int, hits: int, misses: int,
+                     lives: int, level: int, fps_line: tuple[str, tuple[int, int, int]] | None,
+                     muted: bool) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """
+        Lay out the HUD as (surface, position) pairs ready for ``Surface.blits``.
+        """
+        layout = []
         total = hits + misses
         acc = (hits / total * 100.0) if total > 0 else 0.0
         
-        # Get current surface dimensions
-        current_width = surf.get_width()
-        current_height = surf.get_height()
-        
         # LEFT SIDE: Level and Lives
         # Scale padding based on window size
         responsive_padding = max(8, int(HUD_PADDING * (min(current_width, current_height) / 540)))
         left_x = responsive_padding
         left_y = responsive_padding
 
-        level_text = self.font.render(f"Level: {level}", True, TEXT_COLOR)
-        surf.blit(level_text, (left_x, left_y))
+        level_text = self.text_cache.render(self.font, f"Level: {level}", TEXT_COLOR)
+        layout.append((level_text, (left_x, left_y)))
         left_y += level_text.get_height() + 4
         
         if level < MAX_LEVEL:
             zombies_in_level = hits % ZOMBIES_PER_LEVEL
             progress_text = f"Progress: {zombies_in_level}/{ZOMBIES_PER_LEVEL}"
-            progress_surf = self.small_font.render(progress_text, True, TEXT_COLOR)
-            surf.blit(progress_surf, (left_x, left_y))
+            progress_surf = self.text_cache.render(self.small_font, progress_text, TEXT_COLOR)
+            layout.append((progress_surf, (left_x, left_y)))
             left_y += progress_surf.get_height() + 8
         else:
-            max_level_text = self.font.render("MAXED", True, (255, 215, 0))
-            surf.blit(max_level_text, (left_x, left_y))
+            max_level_text = self.text_cache.render(self.font, "MAXED", (255, 215, 0))
+            layout.append((max_level_text, (left_x, left_y)))
             left_y += max_level_text.get_height() + 8
         
         # Lives display with brain icon format
         if self.brain_icon:
             # Draw brain icon and text in format: <brain_png>: X
-            surf.blit(self.brain_icon, (left_x, left_y))
+            layout.append((self.brain_icon, (left_x, left_y)))
             # Responsive offset based on icon size
             icon_offset = self.brain_icon.get_width() + 5
-            lives_text = self.font.render(f": {lives}", True, TEXT_COLOR)
-            surf.blit(lives_text, (left_x + icon_offset, left_y))
+            lives_text = self.text_cache.render(self.font, f": {lives}", TEXT_COLOR)
+            layout.append((lives_text, (left_x + icon_offset, left_y)))
         
         # RIGHT SIDE: Stats and optional indicators - Responsive positioning
-        # Calculate right side position based on content width and window size
-        stats_width = 0
-        temp_stats = [
-            f"Hits: {hits}",
-            f"Misses: {misses}",
-            f"Accuracy: {acc:.1f}%",
+        right_stats = [
+            self.text_cache.render(self.font, line, TEXT_COLOR)
+            for line in (f"Hits: {hits}", f"Misses: {misses}", f"Accuracy: {acc:.1f}%")
         ]
         
-        # Find the widest stat line to calculate proper positioning
-        for line in temp_stats:
-            text_surf = self.font.render(line, True, TEXT_COLOR)
-            stats_width = max(stats_width, text_surf.get_width())
-        
-        # Position right side with proper spacing
+        # Position right side from the widest stat line
+        stats_width = max(text_surf.get_width() for text_surf in right_stats)
         right_x = current_width - stats_width - responsive_padding
         right_y = responsive_padding
         
-        right_stats = [
-            f"Hits: {hits}",
-            f"Misses: {misses}",
-            f"Accuracy: {acc:.1f}%",
-        ]
-        
-        for line in right_stats:
-            text_surf = self.font.render(line, True, TEXT_COLOR)
-            surf.blit(text_surf, (right_x, right_y))
+        for text_surf in right_stats:
+            layout.append((text_surf, (right_x, right_y)))
             right_y += text_surf.get_height() + 4
         
-        if show_fps:
+        if fps_line:
             right_y += 4  # Extra spacing
-            fps_color = (0, 255, 0) if fps >= 55 else (255, 255, 0) if fps >= 30 else (255, 0, 0)
-            fps_text = self.small_font.render(f"FPS: {fps:.1f}", True, fps_color)
-            surf.blit(fps_text, (right_x, right_y))
+            fps_text = self.text_cache.render(self.small_font, *fps_line)
+            layout.append((fps_text, (right_x, right_y)))
             right_y += fps_text.get_height() + 4
         
         if muted:
             right_y += 4  # Extra spacing  
-            muted_text = self.small_font.render("MUTED", True, (255, 150, 150))
-            surf.blit(muted_text, (right_x, right_y))
+            muted_text = self.text_cache.render(self.small_font, "MUTED", (255, 150, 150))
+            layout.append((muted_text, (right_x, right_y)))
 
-        if paused:
-            pause_text = self.font.render("PAUSED", True, (255, 255, 100))
-            # Responsive positioning - scale based on window height
-            pause_y = max(80, int(current_height * 0.15))  # 15% from top, minimum 80px
-            text_rect = pause_text.get_rect(center=(current_width//2, pause_y))
-            # Semi-transparent background
-            bg_rect = text_rect.inflate(20, 10)
-            bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-            bg_surf.fill((0, 0, 0, 128))
-            surf.blit(bg_surf, bg_rect)
-            surf.blit(pause_text, text_rect)
+        return layout
 
 
 class GameOverScreen:
@@ -142,11 +189,13 @@ class GameOverScreen:
     def __init__(self, font_big: pygame.font.Font, font_small: pygame.font.Font):
         self.font_big = font_big
         self.font_small = font_small
+        self.text_cache = TextCache()
     
     def update_fonts(self, new_font_big: pygame.font.Font, new_font_small: pygame.font.Font) -> None:
         """Update fonts for responsive scaling."""
         self.font_big = new_font_big
         self.font_small = new_font_small
+        self.text_cache.clear()
         
     def draw(self, surf: pygame.Surface, hits: int, misses: int) -> None:
         """
@@ -156,15 +205,13 @@ class GameOverScreen:
         current_width = surf.get_width()
         current_height = surf.get_height()
         
-        # Semi-transparent overlay
-        overlay = pygame.Surface((current_width, current_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surf.blit(overlay, (0, 0))
+        # Semi-transparent overlay: multiplying by 75/255 matches 180-alpha black, without a full-window SRCALPHA surface
+        surf.fill((75, 75, 75), special_flags=pygame.BLEND_RGB_MULT)
         
-        game_over_text = self.font_big.render("GAME OVER", True, (255, 100, 100))
+        game_over_text = self.text_cache.render(self.font_big, "GAME OVER", (255, 100, 100))
         title_y = max(80, int(current_height * 0.25))  # 25% from top, minimum 80px
-        game_over_rect = game_over_text.get_rect(center=(current_width//2, title_y))
-        surf.blit(game_over_text, game_over_rect)
+        # Every line is collected first and blitted in one call at the end
+        blit_list = [(game_over_text, game_over_text.get_rect(center=(current_width//2, title_y)))]
         
         # Final stats
         total = hits + misses
@@ -182,12 +229,11 @@ class GameOverScreen:
         stats_start_y = max(title_y + 80, int(current_height * 0.4))  # 40% from top or below title
         y_offset = stats_start_y
         for line in stats_lines:
-            text_surf = self.font_small.render(line, True, TEXT_COLOR)
-            text_rect = text_surf.get_rect(center=(current_width // 2, y_offset))
-            surf.blit(text_surf, text_rect)
+            text_surf = self.text_cache.render(self.font_small, line, TEXT_COLOR)
+            blit_list.append((text_surf, text_surf.get_rect(center=(current_width // 2, y_offset))))
             y_offset += 30
 
-        inst_text = self.font_small.render("Press R to restart or ESC to quit", True, (150, 150, 150))
+        inst_text = self.text_cache.render(self.font_small, "Press R to restart or ESC to quit", (150, 150, 150))
         inst_y = y_offset + 30
-        inst_rect = inst_text.get_rect(center=(current_width // 2, inst_y))
-        surf.blit(inst_text, inst_rect)
+        blit_list.append((inst_text, inst_text.get_rect(center=(current_width // 2, inst_y))))
+        surf.blits(blit_list, False)